@@ -1,15 +1,18 @@
 """Admin API endpoints for user and team management."""
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Optional
 
+import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import Engine, func
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import AuthenticatedUser, get_current_user
 from app.config import Settings, get_settings
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models import (
     AuditLog,
     SecurityEvent,
@@ -33,6 +36,8 @@ from app.services.label_policy_service import LabelPolicyService
 from app.services.team_service import TeamService
 from app.services.user_service import UserService
 
+logger = structlog.get_logger()
+
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
@@ -108,37 +113,42 @@ async def list_security_events(
     if user_identity:
         query = query.filter(SecurityEvent.user_identity == user_identity)
 
+    # Project only the response columns; the count reuses the same filters
+    total = query.with_entities(func.count(SecurityEvent.id)).scalar()
     events = (
-        query.order_by(SecurityEvent.timestamp.desc()).limit(limit).offset(offset).all()
+        query.with_entities(
+            SecurityEvent.id,
+            SecurityEvent.event_type,
+            SecurityEvent.severity,
+            SecurityEvent.runner_id,
+            SecurityEvent.runner_name,
+            SecurityEvent.github_runner_id,
+            SecurityEvent.user_identity,
+            SecurityEvent.violation_data,
+            SecurityEvent.action_taken,
+            SecurityEvent.timestamp,
+        )
+        .order_by(SecurityEvent.timestamp.desc())
+        .limit(limit)
+        .offset(offset)
+        .all()
     )
 
-    event_responses = []
-    for event in events:
-        event_responses.append(
-            SecurityEventResponse(
-                id=event.id,
-                event_type=event.event_type,
-                severity=event.severity,
-                runner_id=event.runner_id,
-                runner_name=event.runner_name,
-                github_runner_id=event.github_runner_id,
-                user_identity=event.user_identity,
-                violation_data=json.loads(event.violation_data),
-                action_taken=event.action_taken,
-                timestamp=event.timestamp,
-            )
+    event_responses = [
+        SecurityEventResponse(
+            id=event.id,
+            event_type=event.event_type,
+            severity=event.severity,
+            runner_id=event.runner_id,
+            runner_name=event.runner_name,
+            github_runner_id=event.github_runner_id,
+            user_identity=event.user_identity,
+            violation_data=json.loads(event.violation_data),
+            action_taken=event.action_taken,
+            timestamp=event.timestamp,
         )
-
-    # Get total count with same filters
-    total_query = db.query(SecurityEvent)
-    if event_type:
-        total_query = total_query.filter(SecurityEvent.event_type == event_type)
-    if severity:
-        total_query = total_query.filter(SecurityEvent.severity == severity)
-    if user_identity:
-        total_query = total_query.filter(SecurityEvent.user_identity == user_identity)
-
-    total = total_query.count()
+        for event in events
+    ]
 
     return SecurityEventListResponse(events=event_responses, total=total)
 
@@ -881,10 +891,10 @@ async def batch_delete_runners(
     ```
     """
     from app.models import Runner
-    from app.github.client import GitHubClient
+    from app.github.client import get_github_client
 
     label_policy_service = LabelPolicyService(db)
-    github = GitHubClient(settings)
+    github = get_github_client(settings)
 
     # Determine which runners to delete
     query = db.query(Runner).filter(Runner.status != "deleted")
@@ -898,19 +908,44 @@ async def batch_delete_runners(
 
     runners_to_delete = query.all()
 
+    # Delete from GitHub concurrently. A runner GitHub no longer knows (404)
+    # counts as deleted; one whose deletion failed is reported as failed and
+    # left untouched locally so it can be retried.
+    github_errors: dict[str, str] = {}
+    registered = [r for r in runners_to_delete if r.github_runner_id]
+    if registered:
+        try:
+            results = await github.delete_runners(
+                [r.github_runner_id for r in registered]
+            )
+        except Exception as e:
+            results = [e] * len(registered)
+        for runner, result in zip(registered, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "batch_delete_github_failed",
+                    runner_id=runner.id,
+                    github_runner_id=runner.github_runner_id,
+                    error=str(result),
+                )
+                github_errors[runner.id] = str(result)
+
     affected = []
     failed = []
 
     for runner in runners_to_delete:
-        try:
-            # Delete from GitHub if it has a GitHub ID
-            if runner.github_runner_id:
-                try:
-                    await github.delete_runner(runner.github_runner_id)
-                except Exception:
-                    # Continue even if GitHub deletion fails
-                    pass
+        if runner.id in github_errors:
+            failed.append(
+                {
+                    "runner_id": runner.id,
+                    "runner_name": runner.runner_name,
+                    "status": "failed",
+                    "error": f"GitHub deletion failed: {github_errors[runner.id]}",
+                }
+            )
+            continue
 
+        try:
             # Update local state
             runner.status = "deleted"
             runner.deleted_at = runner.deleted_at or datetime.utcnow()
@@ -947,6 +982,7 @@ async def batch_delete_runners(
             "affected_count": len(affected),
             "failed_count": len(failed),
             "runner_ids": [r["runner_id"] for r in affected],
+            "failed_runner_ids": [r["runner_id"] for r in failed],
             "target_user": request.user_identity,
             "scope": "specific"
             if request.runner_ids
@@ -1220,24 +1256,35 @@ async def batch_reactivate_teams(
     )
 
 
-@router.get("/stats")
-async def get_admin_stats(
-    admin: AuthenticatedUser = Depends(require_admin),  # noqa: ARG001
-    db: Session = Depends(get_db),
-):
+def _collect_admin_stats(bind: Engine) -> dict:
     """
-    Get comprehensive system statistics for the admin console.
+    Run the blocking count queries behind the admin stats endpoint.
 
-    **Required Authentication:** Admin privileges
+    Runs in a worker thread, so it opens its own session on the request
+    session's engine instead of sharing the one owned by the event loop.
     """
+    with SessionLocal(bind=bind) as db:
+        return _count_admin_stats(db)
+
+
+def _count_admin_stats(db: Session) -> dict:
+    """Count runners, users, teams and events for the admin stats endpoint."""
     from app.models import Runner, User, SecurityEvent, AuditLog, Team
 
+    # One GROUP BY instead of a COUNT query per runner status
+    runner_counts = dict(
+        db.query(Runner.status, func.count(Runner.id))
+        .filter(Runner.status != "deleted")
+        .group_by(Runner.status)
+        .all()
+    )
+
     return {
         "runners": {
-            "total": db.query(Runner).filter(Runner.status != "deleted").count(),
-            "active": db.query(Runner).filter(Runner.status == "active").count(),
-            "offline": db.query(Runner).filter(Runner.status == "offline").count(),
-            "pending": db.query(Runner).filter(Runner.status == "pending").count(),
+            "total": sum(runner_counts.values()),
+            "active": runner_counts.get("active", 0),
+            "offline": runner_counts.get("offline", 0),
+            "pending": runner_counts.get("pending", 0),
         },
         "users": {
             "total": db.query(User).count(),
@@ -1264,3 +1311,17 @@ async def get_admin_stats(
             .count(),
         },
     }
+
+
+@router.get("/stats")
+async def get_admin_stats(
+    admin: AuthenticatedUser = Depends(require_admin),  # noqa: ARG001
+    db: Session = Depends(get_db),
+):
+    """
+    Get comprehensive system statistics for the admin console.
+
+    **Required Authentication:** Admin privileges
+    """
+    # A dozen count queries; keep them off the event loop
+    return await asyncio.to_thread(_collect_admin_stats, db.get_bind())
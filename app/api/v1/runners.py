@@ -1,6 +1,5 @@
 """Runner management API endpoints."""
 
-import json
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -149,7 +148,7 @@ async def list_runners(
                 status=runner.status,
                 github_runner_id=runner.github_runner_id,
                 runner_group_id=runner.runner_group_id,
-                labels=json.loads(runner.labels),
+                labels=runner.label_list,
                 ephemeral=runner.ephemeral,
                 provisioned_by=runner.provisioned_by,
                 created_at=runner.created_at,
@@ -194,7 +193,7 @@ async def get_runner(
         status=runner.status,
         github_runner_id=runner.github_runner_id,
         runner_group_id=runner.runner_group_id,
-        labels=json.loads(runner.labels) if runner.labels else [],
+        labels=runner.label_list,
         ephemeral=runner.ephemeral,
         provisioned_by=runner.provisioned_by,
         created_at=runner.created_at,
@@ -239,7 +238,7 @@ async def refresh_runner_status(
         status=runner.status,
         github_runner_id=runner.github_runner_id,
         runner_group_id=runner.runner_group_id,
-        labels=json.loads(runner.labels),
+        labels=runner.label_list,
         ephemeral=runner.ephemeral,
         provisioned_by=runner.provisioned_by,
         created_at=runner.created_at,
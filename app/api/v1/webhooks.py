@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.config import Settings, get_settings
 from app.database import get_db
-from app.github.client import GitHubClient
+from app.github.client import get_github_client
 from app.metrics import runner_state_transitions_total
 from app.models import Runner
 from app.services.label_policy_service import LabelPolicyService, LabelPolicyViolation
@@ -84,7 +84,7 @@ async def validate_runner_labels(
         return None, None
 
     # Fetch actual labels from GitHub
-    github_client = GitHubClient(settings)
+    github_client = get_github_client(settings)
     github_runner = await github_client.get_runner_by_id(runner_id)
 
     if not github_runner:
@@ -281,7 +281,7 @@ async def handle_workflow_job(
     action_taken = None
 
     if settings.label_policy_enforcement == "enforce":
-        github_client = GitHubClient(settings)
+        github_client = get_github_client(settings)
         try:
             cancelled = await github_client.cancel_workflow_run(repo_name, run_id)
             if cancelled:
@@ -5,11 +5,12 @@ import json
 from datetime import datetime, timedelta, timezone
 
 import click
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.database import SessionLocal, init_db
-from app.github.client import GitHubClient
+from app.github.client import GitHubClient, GitHubRunnerInfo
 from app.models import AuditLog, Runner, User
 from app.services.user_service import UserService
 
@@ -31,37 +32,11 @@ def init_db_cmd():
         raise SystemExit(1)
 
 
-@cli.command()
-@click.option("--hours", default=24, help="Hours before considering runner stale")
-@click.option(
-    "--dry-run", is_flag=True, help="Show what would be deleted without deleting"
-)
-def cleanup_stale_runners(hours: int, dry_run: bool):
-    """Cleanup stale offline runners."""
-    settings = get_settings()
-    db: Session = SessionLocal()
-
+async def _cleanup_runners(
+    github: GitHubClient, db: Session, stale_runners: list[Runner], dry_run: bool
+) -> None:
+    """Delete stale runners from GitHub and mark them deleted, one at a time."""
     try:
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        # Find stale runners
-        stale_runners = (
-            db.query(Runner)
-            .filter(
-                Runner.status.in_(["pending", "offline"]),
-                Runner.created_at < cutoff_time,
-            )
-            .all()
-        )
-
-        if not stale_runners:
-            click.echo("No stale runners found")
-            return
-
-        click.echo(f"Found {len(stale_runners)} stale runners:")
-
-        github = GitHubClient(settings)
-
         for runner in stale_runners:
             age_hours = (
                 datetime.now(timezone.utc) - runner.created_at
@@ -75,20 +50,54 @@ def cleanup_stale_runners(hours: int, dry_run: bool):
                 # Delete from GitHub if exists
                 if runner.github_runner_id:
                     try:
-                        deleted = asyncio.run(
-                            github.delete_runner(runner.github_runner_id)
-                        )
-                        if deleted:
+                        if await github.delete_runner(runner.github_runner_id):
                             click.echo("    ✓ Deleted from GitHub")
                     except Exception as e:
                         click.echo(f"    ✗ Failed to delete from GitHub: {e}", err=True)
 
-                # Update local state
+                # Update local state right away: the GitHub delete above
+                # cannot be rolled back
                 runner.status = "deleted"
                 runner.deleted_at = datetime.now(timezone.utc)
                 db.commit()
 
                 click.echo("    ✓ Marked as deleted in database")
+    finally:
+        # Release pooled connections before asyncio.run closes the loop
+        await github.aclose()
+
+
+@cli.command()
+@click.option("--hours", default=24, help="Hours before considering runner stale")
+@click.option(
+    "--dry-run", is_flag=True, help="Show what would be deleted without deleting"
+)
+def cleanup_stale_runners(hours: int, dry_run: bool):
+    """Cleanup stale offline runners."""
+    settings = get_settings()
+
+    try:
+        with SessionLocal() as db:
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            # Find stale runners
+            stale_runners = (
+                db.query(Runner)
+                .filter(
+                    Runner.status.in_(["pending", "offline"]),
+                    Runner.created_at < cutoff_time,
+                )
+                .all()
+            )
+
+            if not stale_runners:
+                click.echo("No stale runners found")
+                return
+
+            click.echo(f"Found {len(stale_runners)} stale runners:")
+
+            github = GitHubClient(settings)
+            asyncio.run(_cleanup_runners(github, db, stale_runners, dry_run))
 
         if dry_run:
             click.echo("\n(Dry run - no changes made)")
@@ -98,8 +107,6 @@ def cleanup_stale_runners(hours: int, dry_run: bool):
     except Exception as e:
         click.echo(f"✗ Cleanup failed: {e}", err=True)
         raise SystemExit(1)
-    finally:
-        db.close()
 
 
 @cli.command()
@@ -107,9 +114,7 @@ def cleanup_stale_runners(hours: int, dry_run: bool):
 @click.option("--user", help="Filter by provisioned_by")
 def list_runners_cmd(status: str, user: str):
     """List all runners."""
-    db: Session = SessionLocal()
-
-    try:
+    with SessionLocal() as db:
         query = db.query(Runner)
 
         if status:
@@ -126,8 +131,7 @@ def list_runners_cmd(status: str, user: str):
         click.echo(f"\nFound {len(runners)} runners:\n")
 
         for runner in runners:
-            labels = json.loads(runner.labels)
-            labels_str = ", ".join(labels) if labels else "none"
+            labels_str = ", ".join(runner.label_list) or "none"
 
             click.echo(f"Name:           {runner.runner_name}")
             click.echo(f"Status:         {runner.status}")
@@ -144,27 +148,30 @@ def list_runners_cmd(status: str, user: str):
 
             click.echo()
 
-    finally:
-        db.close()
-
 
 @cli.command()
-@click.option("--since", help="Filter events since date (YYYY-MM-DD)")
+@click.option(
+    "--since",
+    help="Filter events since an ISO 8601 date or datetime (e.g. YYYY-MM-DD)",
+)
 @click.option("--event-type", help="Filter by event type")
 @click.option("--user", help="Filter by user")
 @click.option("--limit", default=100, help="Maximum number of events")
 @click.option("--output", help="Output to JSON file")
 def export_audit_log(since: str, event_type: str, user: str, limit: int, output: str):
     """Export audit log."""
-    db: Session = SessionLocal()
-
-    try:
+    with SessionLocal() as db:
         query = db.query(AuditLog)
 
         if since:
-            since_date = datetime.strptime(since, "%Y-%m-%d").replace(
-                tzinfo=timezone.utc
-            )
+            try:
+                since_date = datetime.fromisoformat(since)
+            except ValueError:
+                raise click.BadParameter(
+                    f"'{since}' is not an ISO 8601 date", param_hint="--since"
+                )
+            if since_date.tzinfo is None:
+                since_date = since_date.replace(tzinfo=timezone.utc)
             query = query.filter(AuditLog.timestamp >= since_date)
         if event_type:
             query = query.filter(AuditLog.event_type == event_type)
@@ -204,72 +211,86 @@ def export_audit_log(since: str, event_type: str, user: str, limit: int, output:
             # Print to stdout
             click.echo(json.dumps(audit_data, indent=2))
 
+
+async def _list_github_runners(github: GitHubClient) -> list[GitHubRunnerInfo]:
+    """List runners from GitHub, closing the client's connections afterwards."""
+    try:
+        return await github.list_runners()
     finally:
-        db.close()
+        await github.aclose()
 
 
 @cli.command()
 def sync_github():
     """Sync runner status with GitHub API."""
     settings = get_settings()
-    db: Session = SessionLocal()
 
     try:
-        # Get all non-deleted runners from database
-        local_runners = db.query(Runner).filter(Runner.status != "deleted").all()
-
-        if not local_runners:
-            click.echo("No runners to sync")
-            return
-
-        click.echo(f"Syncing {len(local_runners)} runners with GitHub...\n")
-
-        github = GitHubClient(settings)
-
-        # Fetch all runners from GitHub
-        github_runners = asyncio.run(github.list_runners())
-        github_runners_by_name = {r.name: r for r in github_runners}
-
-        updates = 0
-
-        for runner in local_runners:
-            github_runner = github_runners_by_name.get(runner.runner_name)
+        with SessionLocal.begin() as db:
+            # Get all non-deleted runners from database
+            local_runners = db.query(Runner).filter(Runner.status != "deleted").all()
 
-            if github_runner:
-                # Runner exists in GitHub
-                old_status = runner.status
-                runner.status = github_runner.status
-                runner.github_runner_id = github_runner.id
+            if not local_runners:
+                click.echo("No runners to sync")
+                return
 
-                if runner.registered_at is None:
-                    runner.registered_at = datetime.now(timezone.utc)
+            click.echo(f"Syncing {len(local_runners)} runners with GitHub...\n")
+
+            github = GitHubClient(settings)
+
+            # Fetch all runners from GitHub
+            github_runners = asyncio.run(_list_github_runners(github))
+            github_runners_by_name = {r.name: r for r in github_runners}
+
+            # Split local runners into those still known to GitHub and those that
+            # disappeared after registration (pending runners may not exist yet).
+            found = [
+                r for r in local_runners if r.runner_name in github_runners_by_name
+            ]
+            stale = [
+                r
+                for r in local_runners
+                if r.runner_name not in github_runners_by_name and r.status != "pending"
+            ]
+
+            now = datetime.now(timezone.utc)
+            updates = 0
+            mappings = []
+
+            for runner in found:
+                github_runner = github_runners_by_name[runner.runner_name]
+                mappings.append(
+                    {
+                        "id": runner.id,
+                        "status": github_runner.status,
+                        "github_runner_id": github_runner.id,
+                        "registered_at": runner.registered_at or now,
+                    }
+                )
 
-                if old_status != runner.status:
+                if runner.status != github_runner.status:
                     click.echo(
-                        f"✓ {runner.runner_name}: {old_status} → {runner.status}"
+                        f"✓ {runner.runner_name}: {runner.status} → {github_runner.status}"
                     )
                     updates += 1
 
-            else:
-                # Runner not found in GitHub
-                if runner.status != "pending":
-                    # Was registered but now deleted
-                    old_status = runner.status
-                    runner.status = "deleted"
-                    runner.deleted_at = datetime.now(timezone.utc)
+            for runner in stale:
+                click.echo(f"✓ {runner.runner_name}: {runner.status} → deleted")
+                updates += 1
 
-                    click.echo(f"✓ {runner.runner_name}: {old_status} → deleted")
-                    updates += 1
-
-        db.commit()
+            if mappings:
+                db.bulk_update_mappings(Runner, mappings)
+            if stale:
+                db.query(Runner).filter(Runner.id.in_([r.id for r in stale])).update(
+                    {Runner.status: "deleted", Runner.deleted_at: now},
+                    synchronize_session=False,
+                )
 
         click.echo(f"\n✓ Sync complete: {updates} runners updated")
 
     except Exception as e:
         click.echo(f"✗ Sync failed: {e}", err=True)
         raise SystemExit(1)
-    finally:
-        db.close()
 
 
 # User management commands
@@ -285,46 +306,45 @@ def create_admin(email: str, oidc_sub: str, display_name: str):
     Use this command to bootstrap the first admin user, or to create
     additional admin users from the command line.
     """
-    db: Session = SessionLocal()
-
     try:
-        user_service = UserService(db)
-
-        # Check if user already exists
-        existing = user_service.get_user_by_email(email)
-        if existing:
-            if existing.is_admin:
-                click.echo(
-                    f"✗ Admin user with email '{email}' already exists", err=True
-                )
-                raise SystemExit(1)
-            else:
-                # Upgrade existing user to admin
-                user_service.update_user(existing.id, is_admin=True)
-                click.echo(f"✓ Upgraded existing user '{email}' to admin")
-                return
+        with SessionLocal() as db:
+            user_service = UserService(db)
+
+            # Check if user already exists (only the columns we need)
+            existing = db.execute(
+                select(User.id, User.is_admin).where(User.email == email)
+            ).first()
+            if existing:
+                if existing.is_admin:
+                    click.echo(
+                        f"✗ Admin user with email '{email}' already exists", err=True
+                    )
+                    raise SystemExit(1)
+                else:
+                    # Upgrade existing user to admin
+                    user_service.update_user(existing.id, is_admin=True)
+                    click.echo(f"✓ Upgraded existing user '{email}' to admin")
+                    return
+
+            # Create new admin user
+            user = user_service.create_user(
+                email=email,
+                oidc_sub=oidc_sub,
+                display_name=display_name or email,
+                is_admin=True,
+                can_use_jit=True,
+                created_by="cli",
+            )
 
-        # Create new admin user
-        user = user_service.create_user(
-            email=email,
-            oidc_sub=oidc_sub,
-            display_name=display_name or email,
-            is_admin=True,
-            can_use_jit=True,
-            created_by="cli",
-        )
-
-        click.echo("✓ Created admin user:")
-        click.echo(f"  ID:           {user.id}")
-        click.echo(f"  Email:        {user.email}")
-        click.echo(f"  Display Name: {user.display_name}")
-        click.echo(f"  Is Admin:     {user.is_admin}")
+            click.echo("✓ Created admin user:")
+            click.echo(f"  ID:           {user.id}")
+            click.echo(f"  Email:        {user.email}")
+            click.echo(f"  Display Name: {user.display_name}")
+            click.echo(f"  Is Admin:     {user.is_admin}")
 
     except ValueError as e:
         click.echo(f"✗ Failed to create admin: {e}", err=True)
         raise SystemExit(1)
-    finally:
-        db.close()
 
 
 @cli.command()
@@ -332,9 +352,7 @@ def create_admin(email: str, oidc_sub: str, display_name: str):
 @click.option("--admins-only", is_flag=True, help="Show only admin users")
 def list_users(include_inactive: bool, admins_only: bool):
     """List all users."""
-    db: Session = SessionLocal()
-
-    try:
+    with SessionLocal() as db:
         query = db.query(User)
 
         if not include_inactive:
@@ -373,9 +391,6 @@ def list_users(include_inactive: bool, admins_only: bool):
                 click.echo(f"Last Login:   {user.last_login_at}")
             click.echo()
 
-    finally:
-        db.close()
-
 
 if __name__ == "__main__":
     cli()
@@ -1,6 +1,6 @@
 """Configuration management for the runner token service."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -53,6 +53,13 @@ class Settings(BaseSettings):
         default=3600,
         description="Seconds before recycling connections (PostgreSQL only)",
     )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description=(
+            "Test connections with a round trip on checkout (PostgreSQL only). "
+            "Can be disabled when db_pool_recycle is below the server idle timeout"
+        ),
+    )
 
     # IAM RDS Authentication (passwordless, for AWS deployments with IRSA)
     db_iam_auth: bool = Field(
@@ -190,9 +197,9 @@ class Settings(BaseSettings):
             raise ValueError(f"GitHub App private key path is not a file: {v}")
         return v
 
-    @property
+    @cached_property
     def github_app_private_key(self) -> str:
-        """Read and return the GitHub App private key."""
+        """Read and return the GitHub App private key (read once, then cached)."""
         return self.github_app_private_key_path.read_text()
 
 
@@ -200,3 +207,7 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached application settings."""
     return Settings()  # type: ignore[arg-type]
+
+
+# Process-wide settings, constructed once so .env is read a single time
+settings: Settings = get_settings()
@@ -1,17 +1,21 @@
 """Database setup and session management."""
 
+import random
 import time
-from typing import Any
-from sqlalchemy import create_engine, event, text
+from functools import lru_cache
+from typing import Any, Optional
+from sqlalchemy import Engine, create_engine, event, make_url, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 import structlog
 
-from app.config import get_settings
+from app.config import settings
 
 logger = structlog.get_logger()
-settings = get_settings()
+
+# Upper bound in seconds for a single connection retry backoff
+MAX_RETRY_DELAY = 30
 
 
 def _get_iam_auth_token() -> str:
@@ -56,6 +60,17 @@ def _get_ssl_connect_args() -> dict[str, Any]:
     return connect_args
 
 
+@lru_cache(maxsize=1)
+def get_database_backend() -> str:
+    """
+    Get the backend name of the configured database URL.
+
+    Returns:
+        SQLAlchemy backend name, e.g. "sqlite" or "postgresql"
+    """
+    return make_url(settings.database_url).get_backend_name()
+
+
 def get_engine_config():
     """Get database engine configuration based on database type."""
     # IAM auth mode: no static DATABASE_URL; token is fetched per connection
@@ -96,8 +111,9 @@ def get_engine_config():
             "echo": False,
             "pool_size": settings.db_pool_size,
             "max_overflow": settings.db_max_overflow,
-            "pool_pre_ping": True,
+            "pool_pre_ping": settings.db_pool_pre_ping,
             "pool_recycle": settings.db_pool_recycle,
+            "pool_use_lifo": True,
         }
 
     config: dict[str, Any] = {
@@ -105,13 +121,16 @@ def get_engine_config():
         "echo": False,
     }
 
-    if "sqlite" in settings.database_url:
+    backend = get_database_backend()
+    if backend == "sqlite":
         config["connect_args"] = {"check_same_thread": False}
-    elif "postgresql" in settings.database_url:
+    elif backend == "postgresql":
         config["pool_size"] = settings.db_pool_size
         config["max_overflow"] = settings.db_max_overflow
-        config["pool_pre_ping"] = True
+        config["pool_pre_ping"] = settings.db_pool_pre_ping
         config["pool_recycle"] = settings.db_pool_recycle
+        # Reuse the most recently returned connection so surplus ones idle out
+        config["pool_use_lifo"] = True
 
         connect_args = _get_ssl_connect_args()
         if connect_args:
@@ -122,24 +141,43 @@ def get_engine_config():
     return config
 
 
-def create_engine_with_retry(max_retries=3, retry_delay=2):
-    """Create database engine with retry logic for transient failures."""
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune SQLite for concurrent access on each new connection.
+
+    WAL lets readers proceed while a write is in progress, and NORMAL
+    synchronous mode skips the fsync on every commit, which WAL keeps safe
+    against corruption.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def create_engine_with_retry(max_retries=5, retry_delay=2):
+    """
+    Create database engine with retry logic for transient failures.
+
+    Retries back off exponentially with up to a second of random jitter, so
+    replicas restarting together do not reconnect in lockstep.
+    """
     config = get_engine_config()
 
     for attempt in range(max_retries):
         try:
             engine = create_engine(**config)
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", _set_sqlite_pragmas)
 
             # Test connection
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
 
             db_type = (
-                "postgresql_iam"
-                if settings.db_iam_auth
-                else "postgresql"
-                if "postgresql" in settings.database_url
-                else "sqlite"
+                "postgresql_iam" if settings.db_iam_auth else get_database_backend()
             )
             logger.info(
                 "database_connected",
@@ -150,14 +188,17 @@ def create_engine_with_retry(max_retries=3, retry_delay=2):
 
         except Exception as e:
             if attempt < max_retries - 1:
+                delay = min(
+                    retry_delay * (2**attempt) + random.random(), MAX_RETRY_DELAY
+                )
                 logger.warning(
                     "database_connection_failed_retrying",
                     error=str(e),
                     attempt=attempt + 1,
                     max_retries=max_retries,
-                    retry_delay=retry_delay,
+                    retry_delay=round(delay, 2),
                 )
-                time.sleep(retry_delay)
+                time.sleep(delay)
             else:
                 logger.error(
                     "database_connection_failed",
@@ -167,25 +208,47 @@ def create_engine_with_retry(max_retries=3, retry_delay=2):
                 raise
 
 
-# Create database engine with retry logic
-engine = create_engine_with_retry()
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Get the database engine, connecting on first use.
+
+    The engine is created lazily so importing this module does not open a
+    database connection.
+
+    Returns:
+        Shared SQLAlchemy engine
+    """
+    engine = create_engine_with_retry()
+
+    # Pool logging fires on every checkout, so only register it when the
+    # messages would actually be emitted
+    if settings.log_level.upper() == "DEBUG":
+        event.listen(engine, "connect", _log_connect)
+        event.listen(engine, "checkout", _log_checkout)
+
+    return engine
 
 
-# Add connection pool logging for debugging
-@event.listens_for(engine, "connect")
-def receive_connect(dbapi_conn, connection_record):
+def _log_connect(dbapi_conn, connection_record):
     """Log database connections."""
     logger.debug("database_connection_established")
 
 
-@event.listens_for(engine, "checkout")
-def receive_checkout(dbapi_conn, connection_record, connection_proxy):
+def _log_checkout(dbapi_conn, connection_record, connection_proxy):
     """Log connection checkouts from pool."""
     logger.debug("database_connection_checkout")
 
 
+class _LazyBindSession(Session):
+    """Session bound to the shared engine, created on first use."""
+
+    def __init__(self, bind: Optional[Engine] = None, **kwargs: Any):
+        super().__init__(bind=bind or get_engine(), **kwargs)
+
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=_LazyBindSession, autocommit=False, autoflush=False)
 
 # Base class for models
 Base = declarative_base()
@@ -208,7 +271,7 @@ def get_db():
 def init_db():
     """Initialize database schema."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("database_schema_initialized")
     except Exception as e:
         logger.error("database_schema_initialization_failed", error=str(e))
@@ -218,7 +281,7 @@ def init_db():
 def check_db_health():
     """Check database health for health check endpoint."""
     try:
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
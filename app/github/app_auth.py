@@ -1,14 +1,81 @@
 """GitHub App authentication using JWT."""
 
+import asyncio
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 import jwt
+import orjson
+import structlog
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 from app.config import Settings
 
+logger = structlog.get_logger()
+
+# Installation tokens are refreshed in the background once they have less than
+# TOKEN_REFRESH_AHEAD left, and synchronously below TOKEN_MIN_VALIDITY.
+TOKEN_REFRESH_AHEAD = timedelta(minutes=10)
+TOKEN_MIN_VALIDITY = timedelta(minutes=5)
+
+# Sent on every GitHub API request by the shared client
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+
+def create_http_client(api_url: str) -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for GitHub API calls.
+
+    HTTP/2 is negotiated when the server supports it, so concurrent requests
+    such as paginated runner listings share one multiplexed connection.
+    """
+    return httpx.AsyncClient(
+        base_url=api_url,
+        headers=GITHUB_API_HEADERS,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+    )
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """Decode a GitHub API response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def parse_github_timestamp(value: str) -> datetime:
+    """
+    Parse a GitHub API timestamp into an aware UTC datetime.
+
+    GitHub returns ``YYYY-MM-DDTHH:MM:SSZ``, which is sliced directly; any
+    other ISO 8601 form falls back to ``datetime.fromisoformat``.
+
+    Args:
+        value: Timestamp string from a GitHub API response
+
+    Returns:
+        Timezone-aware datetime
+    """
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(value)
+
 
 class GitHubAppAuth:
     """Handles GitHub App authentication and token generation."""
@@ -16,34 +83,94 @@ class GitHubAppAuth:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.app_id = settings.github_app_id
+        self._iss = str(self.app_id)
         self.installation_id = settings.github_app_installation_id
         self.private_key = settings.github_app_private_key
         self.api_url = settings.github_api_url
 
+        # Parsed from the PEM on first use and reused for every JWT
+        self._signing_key: Optional[RSAPrivateKey] = None
+
+        # Last minted app JWT, reused until shortly before it expires
+        self._jwt: Optional[str] = None
+        self._jwt_exp: int = 0
+
         self._installation_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Single-flight guard so concurrent callers share one token fetch
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Connections are bound to the event loop they were opened on, so a new
+        client is created when called from a different loop. The old client
+        cannot be closed from there; code that drives its own short-lived loop
+        (the CLI) must ``aclose()`` before that loop ends.
+
+        Returns:
+            Pooled httpx.AsyncClient for the GitHub API
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = create_http_client(self.api_url)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
 
     def _generate_jwt(self) -> str:
         """
         Generate a JWT for GitHub App authentication.
 
+        The JWT is cached and reused until it is within 60 seconds of expiry.
+
         Returns:
             JWT token string valid for 10 minutes
         """
         now = int(time.time())
+        if self._jwt and now < self._jwt_exp - 60:
+            return self._jwt
+
         # JWT expires after 10 minutes (max allowed by GitHub)
         expiration = now + (10 * 60)
 
         payload = {
             "iat": now - 60,  # Issued 60 seconds in the past to allow for clock drift
             "exp": expiration,
-            "iss": str(self.app_id),
+            "iss": self._iss,
         }
 
         # Sign the JWT with the private key
-        token = jwt.encode(payload, self.private_key, algorithm="RS256")
+        token = jwt.encode(payload, self._get_signing_key(), algorithm="RS256")
+        self._jwt = token
+        self._jwt_exp = expiration
         return token
 
+    def _get_signing_key(self) -> RSAPrivateKey:
+        """
+        Get the parsed RSA signing key, loading it from the PEM on first use.
+
+        Returns:
+            Private key object, so PyJWT does not re-parse the PEM per JWT
+        """
+        if self._signing_key is None:
+            key = load_pem_private_key(self.private_key.encode(), password=None)
+            if not isinstance(key, RSAPrivateKey):
+                raise ValueError("GitHub App private key must be an RSA key")
+            self._signing_key = key
+        return self._signing_key
+
     async def get_installation_token(self, force_refresh: bool = False) -> str:
         """
         Get a GitHub App installation access token.
@@ -59,44 +186,103 @@ class GitHubAppAuth:
         """
         # Return cached token if still valid
         if not force_refresh and self._installation_token and self._token_expires_at:
-            # Refresh if token expires in less than 5 minutes
-            if datetime.now(timezone.utc) < self._token_expires_at - timedelta(
-                minutes=5
+            remaining = self._token_expires_at - datetime.now(timezone.utc)
+            if remaining > TOKEN_REFRESH_AHEAD:
+                return self._installation_token
+            if remaining > TOKEN_MIN_VALIDITY:
+                # Still usable: serve it now and refresh in the background
+                self._schedule_background_refresh()
+                return self._installation_token
+
+        return await self._refresh_installation_token()
+
+    def _schedule_background_refresh(self) -> None:
+        """Start a background token refresh unless one is already running."""
+        task = self._refresh_task
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Refresh the installation token, logging instead of raising on failure."""
+        try:
+            await self._refresh_installation_token()
+        except Exception as e:
+            logger.warning("github_installation_token_refresh_failed", error=str(e))
+
+    def _get_refresh_lock(self) -> asyncio.Lock:
+        """Get the refresh lock, replacing it if the event loop has changed."""
+        loop = asyncio.get_running_loop()
+        if self._refresh_lock_loop is not loop:
+            self._refresh_lock = asyncio.Lock()
+            self._refresh_lock_loop = loop
+        return self._refresh_lock
+
+    async def _refresh_installation_token(self) -> str:
+        """
+        Fetch a new installation access token from GitHub and cache it.
+
+        Concurrent callers are coalesced: whoever acquires the lock first
+        performs the fetch, and callers that were waiting on it reuse the
+        token it obtained instead of fetching again.
+
+        Returns:
+            Installation access token
+
+        Raises:
+            httpx.HTTPError: If token generation fails
+        """
+        stale_token = self._installation_token
+        async with self._get_refresh_lock():
+            # Another coroutine refreshed the token while we were waiting
+            if (
+                self._installation_token
+                and self._installation_token != stale_token
+                and self._token_expires_at
+                and self._token_expires_at - datetime.now(timezone.utc)
+                > TOKEN_MIN_VALIDITY
             ):
                 return self._installation_token
+            return await self._fetch_installation_token()
+
+    async def _fetch_installation_token(self) -> str:
+        """
+        Request a new installation access token from the GitHub API.
+
+        Returns:
+            Installation access token
 
-        # Generate new installation token
+        Raises:
+            httpx.HTTPError: If token generation fails
+        """
         jwt_token = self._generate_jwt()
 
-        url = f"{self.api_url}/app/installations/{self.installation_id}/access_tokens"
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
+        url = f"/app/installations/{self.installation_id}/access_tokens"
+        headers = {"Authorization": f"Bearer {jwt_token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers)
-            response.raise_for_status()
+        client = await self.get_http_client()
+        response = await client.post(url, headers=headers)
+        response.raise_for_status()
 
-            data = response.json()
-            self._installation_token = data["token"]
-            self._token_expires_at = datetime.fromisoformat(
-                data["expires_at"].replace("Z", "+00:00")
-            )
+        data = decode_json(response)
+        self._installation_token = data["token"]
+        self._token_expires_at = parse_github_timestamp(data["expires_at"])
 
-            return self._installation_token
+        return self._installation_token
 
     async def get_authenticated_headers(self) -> dict:
         """
         Get HTTP headers with GitHub App authentication.
 
+        Only the Authorization header is returned; the Accept and API version
+        headers are set once on the shared HTTP client.
+
         Returns:
-            Dictionary of headers including Bearer token
+            Dictionary with the Bearer token Authorization header
         """
         token = await self.get_installation_token()
-        return {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        }
+        return {"Authorization": f"Bearer {token}"}
@@ -1,13 +1,63 @@
 """GitHub API client for runner operations."""
 
+import asyncio
+import math
+import operator
+import random
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional, Union
 
 import httpx
+import structlog
 
-from app.config import Settings
-from app.github.app_auth import GitHubAppAuth
+from app.config import Settings, settings
+from app.github.app_auth import GitHubAppAuth, decode_json
+
+logger = structlog.get_logger()
+
+# Seconds to serve cached API listings: runners change often, groups rarely
+RUNNERS_CACHE_TTL = 10.0
+RUNNER_GROUPS_CACHE_TTL = 300.0
+
+# Retries for rate-limited requests. Retry n waits at most 2**n seconds (plus
+# jitter), so a throttled call gives up within the HTTP client timeout instead
+# of holding an API request open until GitHub's reset.
+RATE_LIMIT_MAX_RETRIES = 3
+
+# Requests in flight at once for batch operations, to stay clear of GitHub's
+# secondary rate limits
+GITHUB_BATCH_CONCURRENCY = 16
+
+# Extracts the name from a GitHub label object
+_LABEL_NAME = operator.itemgetter("name")
+
+
+class TTLCache:
+    """Small in-process cache whose entries expire a fixed time after being set."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value under key."""
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
 
 
 @dataclass
@@ -21,16 +71,29 @@ class JitConfigResponse:
     labels: Optional[List[str]] = None
 
 
+@dataclass(frozen=True, slots=True)
 class GitHubRunnerInfo:
     """GitHub runner information."""
 
-    def __init__(self, data: dict):
-        self.id = data["id"]
-        self.name = data["name"]
-        self.os = data.get("os")
-        self.status = data.get("status")
-        self.busy = data.get("busy", False)
-        self.labels = [label["name"] for label in data.get("labels", [])]
+    id: int
+    name: str
+    os: Optional[str] = None
+    status: Optional[str] = None
+    busy: bool = False
+    labels: tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict) -> "GitHubRunnerInfo":
+        """Build from a runner object returned by the GitHub API."""
+        get = data.get
+        return cls(
+            data["id"],
+            data["name"],
+            get("os"),
+            get("status"),
+            get("busy", False),
+            tuple(map(_LABEL_NAME, get("labels") or ())),
+        )
 
 
 class GitHubClient:
@@ -42,60 +105,119 @@ class GitHubClient:
         self.org = settings.github_org
         self.api_url = settings.github_api_url
 
-    async def generate_registration_token(self) -> tuple[str, datetime]:
-        """
-        Generate a runner registration token.
+        # API paths relative to the shared client's base_url
+        self._runners_path = f"/orgs/{self.org}/actions/runners"
+        self._runner_groups_path = f"/orgs/{self.org}/actions/runner-groups"
+        self._jit_config_path = f"{self._runners_path}/generate-jitconfig"
 
-        Returns:
-            Tuple of (token, expires_at)
+        # list_runners results as (runners, runners by name), per page size
+        self._runners_cache = TTLCache(RUNNERS_CACHE_TTL)
+        self._runner_groups_cache = TTLCache(RUNNER_GROUPS_CACHE_TTL)
 
-        Raises:
-            httpx.HTTPError: If token generation fails
+        # Epoch time until which GitHub reported the rate limit as exhausted
+        self._rate_limit_reset = 0.0
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections held by this client."""
+        await self.auth.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners/registration-token"
-        headers = await self.auth.get_authenticated_headers()
+        Send a GitHub API request, waiting out rate limits.
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers)
-            response.raise_for_status()
+        Responses that GitHub marks as rate limited (429, or 403 with
+        Retry-After or an exhausted quota) are retried up to
+        RATE_LIMIT_MAX_RETRIES times, waiting min(retry_after, 2**attempt)
+        seconds plus jitter. When a response reports the quota as exhausted,
+        later requests first pause briefly (at most one second) before sending.
 
-            data = response.json()
-            token = data["token"]
-            expires_at = datetime.fromisoformat(
-                data["expires_at"].replace("Z", "+00:00")
+        Args:
+            method: HTTP method name, e.g. "get"
+            url: Path relative to the API base URL
+            **kwargs: Passed through to httpx
+
+        Returns:
+            The final response, which may still be an error status
+        """
+        client = await self.auth.get_http_client()
+        send = getattr(client, method)
+
+        # Quota already reported as exhausted: back off before sending, bounded
+        # like the first retry
+        wait = self._rate_limit_reset - time.time()
+        if wait > 0:
+            logger.warning("github_rate_limit_wait", reset_in=round(wait, 1))
+            await asyncio.sleep(min(wait, 1.0))
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            response = await send(url, **kwargs)
+            delay = self._record_rate_limit(response, attempt)
+            if delay is None or attempt == RATE_LIMIT_MAX_RETRIES:
+                return response
+
+            logger.warning(
+                "github_rate_limited",
+                method=method.upper(),
+                url=url,
+                status_code=response.status_code,
+                attempt=attempt + 1,
+                retry_in=round(delay, 1),
             )
+            await asyncio.sleep(delay)
 
-            return token, expires_at
+        return response
 
-    async def generate_removal_token(self) -> tuple[str, datetime]:
+    def _record_rate_limit(
+        self, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
         """
-        Generate a runner removal token.
+        Track GitHub's rate limit headers from a response.
 
-        Returns:
-            Tuple of (token, expires_at)
+        Args:
+            response: Response to inspect
+            attempt: Zero-based attempt number of the request
 
-        Raises:
-            httpx.HTTPError: If token generation fails
+        Returns:
+            Seconds to wait before retrying if the response was rate limited,
+            otherwise None
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners/remove-token"
-        headers = await self.auth.get_authenticated_headers()
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            logger.debug(
+                "github_rate_limit",
+                limit=headers.get("X-RateLimit-Limit"),
+                remaining=remaining,
+                reset=reset,
+            )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers)
-            response.raise_for_status()
+        exhausted = remaining == "0" and reset is not None and reset.isdigit()
+        if exhausted:
+            self._rate_limit_reset = float(reset)
 
-            data = response.json()
-            token = data["token"]
-            expires_at = datetime.fromisoformat(
-                data["expires_at"].replace("Z", "+00:00")
-            )
+        status = response.status_code
+        retry_after = headers.get("Retry-After")
+        has_retry_after = retry_after is not None and retry_after.isdigit()
+        if status != 429 and not (status == 403 and (has_retry_after or exhausted)):
+            return None
 
-            return token, expires_at
+        if has_retry_after:
+            wait = float(retry_after)
+        elif exhausted:
+            wait = float(reset) - time.time()
+        else:
+            wait = float(2**attempt)
+        return max(0.0, min(wait, 2.0**attempt)) + random.uniform(0, 0.5)
 
     async def list_runners(self, per_page: int = 100) -> List[GitHubRunnerInfo]:
         """
         List all runners in the organization.
 
+        The first page reports the total count; any remaining pages are then
+        fetched concurrently over the shared connection pool. Results are
+        cached for a few seconds.
+
         Args:
             per_page: Number of results per page
 
@@ -105,24 +227,62 @@ class GitHubClient:
         Raises:
             httpx.HTTPError: If API call fails
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners"
+        runners, _ = await self._list_runners_indexed(per_page)
+        return list(runners)
+
+    async def _list_runners_indexed(
+        self, per_page: int = 100
+    ) -> tuple[List[GitHubRunnerInfo], dict[str, GitHubRunnerInfo]]:
+        """
+        List all runners, together with an index of them by name.
+
+        Args:
+            per_page: Number of results per page
+
+        Returns:
+            Tuple of (runners, runners keyed by name)
+
+        Raises:
+            httpx.HTTPError: If API call fails
+        """
+        key = ("list_runners", per_page)
+        cached = self._runners_cache.get(key)
+        if cached is not None:
+            return cached
+
+        url = self._runners_path
         headers = await self.auth.get_authenticated_headers()
-        params = {"per_page": per_page}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
+        async def fetch_page(page: int) -> dict:
+            params = {"per_page": per_page, "page": page}
+            response = await self._request("get", url, headers=headers, params=params)
             response.raise_for_status()
+            return decode_json(response)
+
+        first = await fetch_page(1)
+        pages = [first]
+        page_count = math.ceil(first.get("total_count", 0) / per_page)
+        if page_count > 1:
+            pages += await asyncio.gather(
+                *(fetch_page(page) for page in range(2, page_count + 1))
+            )
 
-            data = response.json()
-            runners = [GitHubRunnerInfo(r) for r in data.get("runners", [])]
-            return runners
+        runners = [
+            GitHubRunnerInfo.from_api(r)
+            for data in pages
+            for r in data.get("runners", [])
+        ]
+        indexed = (runners, {runner.name: runner for runner in runners})
+        self._runners_cache.set(key, indexed)
+        return indexed
 
     async def get_runner_by_name(self, name: str) -> Optional[GitHubRunnerInfo]:
         """
         Get a runner by name.
 
         Note: GitHub API does not support filtering by name, so we fetch all
-        runners and filter client-side.
+        runners and look the name up client-side. Listings are cached briefly,
+        so repeated lookups do not each page through the API.
 
         Args:
             name: Runner name
@@ -133,11 +293,8 @@ class GitHubClient:
         Raises:
             httpx.HTTPError: If API call fails
         """
-        runners = await self.list_runners()
-        for runner in runners:
-            if runner.name == name:
-                return runner
-        return None
+        _, by_name = await self._list_runners_indexed()
+        return by_name.get(name)
 
     async def get_runner_by_id(self, runner_id: int) -> Optional[GitHubRunnerInfo]:
         """
@@ -152,18 +309,49 @@ class GitHubClient:
         Raises:
             httpx.HTTPError: If API call fails (including 404)
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners/{runner_id}"
         headers = await self.auth.get_authenticated_headers()
+        return await self._get_runner(headers, runner_id)
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return GitHubRunnerInfo(response.json())
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+    async def get_runners_by_ids(
+        self, runner_ids: List[int]
+    ) -> List[Union[Optional[GitHubRunnerInfo], BaseException]]:
+        """
+        Get several runners by ID concurrently.
+
+        Authentication headers are resolved once for the whole batch, and at
+        most GITHUB_BATCH_CONCURRENCY requests are in flight at a time.
+
+        Args:
+            runner_ids: GitHub runner IDs
+
+        Returns:
+            One entry per ID, in order: GitHubRunnerInfo, None if not found,
+            or the exception raised for that runner
+        """
+        headers = await self.auth.get_authenticated_headers()
+        semaphore = asyncio.Semaphore(GITHUB_BATCH_CONCURRENCY)
+
+        async def get_one(runner_id: int) -> Optional[GitHubRunnerInfo]:
+            async with semaphore:
+                return await self._get_runner(headers, runner_id)
+
+        return await asyncio.gather(
+            *(get_one(runner_id) for runner_id in runner_ids), return_exceptions=True
+        )
+
+    async def _get_runner(
+        self, headers: dict, runner_id: int
+    ) -> Optional[GitHubRunnerInfo]:
+        """Fetch one runner, returning None on 404."""
+        url = f"{self._runners_path}/{runner_id}"
+        try:
+            response = await self._request("get", url, headers=headers)
+            response.raise_for_status()
+            return GitHubRunnerInfo.from_api(decode_json(response))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
     async def delete_runner(self, runner_id: int) -> bool:
         """
@@ -178,38 +366,81 @@ class GitHubClient:
         Raises:
             httpx.HTTPError: If API call fails (except 404)
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners/{runner_id}"
         headers = await self.auth.get_authenticated_headers()
+        deleted = await self._delete_runner(headers, runner_id)
+        if deleted:
+            self._runners_cache.invalidate()
+        return deleted
+
+    async def delete_runners(
+        self, runner_ids: List[int]
+    ) -> List[Union[bool, BaseException]]:
+        """
+        Delete several runners from GitHub concurrently.
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.delete(url, headers=headers)
-                response.raise_for_status()
-                return True
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return False
-                raise
+        Authentication headers are resolved once for the whole batch, and at
+        most GITHUB_BATCH_CONCURRENCY requests are in flight at a time.
+
+        Args:
+            runner_ids: GitHub runner IDs
+
+        Returns:
+            One entry per ID, in order: True if deleted, False if not found,
+            or the exception raised for that runner
+        """
+        headers = await self.auth.get_authenticated_headers()
+        semaphore = asyncio.Semaphore(GITHUB_BATCH_CONCURRENCY)
+
+        async def delete_one(runner_id: int) -> bool:
+            async with semaphore:
+                return await self._delete_runner(headers, runner_id)
+
+        results = await asyncio.gather(
+            *(delete_one(runner_id) for runner_id in runner_ids),
+            return_exceptions=True,
+        )
+        if any(result is True for result in results):
+            self._runners_cache.invalidate()
+        return results
+
+    async def _delete_runner(self, headers: dict, runner_id: int) -> bool:
+        """Delete one runner, returning False on 404."""
+        url = f"{self._runners_path}/{runner_id}"
+        try:
+            response = await self._request("delete", url, headers=headers)
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return False
+            raise
 
     async def get_runner_groups(self) -> List[dict]:
         """
         List runner groups in the organization.
 
+        Groups change rarely, so results are cached for several minutes.
+
         Returns:
             List of runner group dictionaries
 
         Raises:
             httpx.HTTPError: If API call fails
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runner-groups"
+        cached = self._runner_groups_cache.get("runner_groups")
+        if cached is not None:
+            return list(cached)
+
+        url = self._runner_groups_path
         headers = await self.auth.get_authenticated_headers()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
+        response = await self._request("get", url, headers=headers)
+        response.raise_for_status()
 
-            data = response.json()
-            return data.get("runner_groups", [])
+        data = decode_json(response)
+        groups = data.get("runner_groups", [])
+        self._runner_groups_cache.set("runner_groups", groups)
+        return list(groups)
 
     async def cancel_workflow_run(self, repo: str, run_id: int) -> bool:
         """
@@ -225,21 +456,20 @@ class GitHubClient:
         Raises:
             httpx.HTTPError: If API call fails (except 404)
         """
-        url = f"{self.api_url}/repos/{self.org}/{repo}/actions/runs/{run_id}/cancel"
+        url = f"/repos/{self.org}/{repo}/actions/runs/{run_id}/cancel"
         headers = await self.auth.get_authenticated_headers()
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=headers)
-                # 202 Accepted is success for cancel
-                if response.status_code == 202:
-                    return True
-                response.raise_for_status()
+        try:
+            response = await self._request("post", url, headers=headers)
+            # 202 Accepted is success for cancel
+            if response.status_code == 202:
                 return True
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return False
-                raise
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return False
+            raise
 
     async def generate_jit_config(
         self,
@@ -269,7 +499,7 @@ class GitHubClient:
                 - 409: Runner name already exists
                 - 422: Invalid parameters (e.g., too many labels)
         """
-        url = f"{self.api_url}/orgs/{self.org}/actions/runners/generate-jitconfig"
+        url = self._jit_config_path
         headers = await self.auth.get_authenticated_headers()
 
         payload = {
@@ -279,17 +509,45 @@ class GitHubClient:
             "work_folder": work_folder,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
+        response = await self._request("post", url, headers=headers, json=payload)
+        response.raise_for_status()
+        self._runners_cache.invalidate()
 
-            data = response.json()
-            runner_data = data.get("runner", {})
+        data = decode_json(response)
+        runner_data = data.get("runner") or {}
+        runner_get = runner_data.get
 
-            return JitConfigResponse(
-                runner_id=runner_data.get("id"),
-                runner_name=runner_data.get("name", name),
-                encoded_jit_config=data.get("encoded_jit_config"),
-                os=runner_data.get("os"),
-                labels=[label["name"] for label in runner_data.get("labels", [])],
-            )
+        return JitConfigResponse(
+            runner_id=runner_get("id"),
+            runner_name=runner_get("name", name),
+            encoded_jit_config=data.get("encoded_jit_config"),
+            os=runner_get("os"),
+            labels=list(map(_LABEL_NAME, runner_get("labels") or ())),
+        )
+
+
+@lru_cache()
+def _get_shared_github_client() -> GitHubClient:
+    """Build the process-wide GitHub client from the application settings."""
+    return GitHubClient(settings)
+
+
+def get_github_client(client_settings: Optional[Settings] = None) -> GitHubClient:
+    """
+    Get a GitHub client for the given settings.
+
+    The application settings map to one shared instance, which keeps the
+    installation token and the HTTP connection pool alive across requests
+    instead of rebuilding them per call. Any other settings object (tests, CLI
+    overrides, another org or app) gets its own client.
+
+    Args:
+        client_settings: Settings to build the client from; defaults to the
+            application settings
+
+    Returns:
+        GitHubClient for client_settings
+    """
+    if client_settings is None or client_settings is settings:
+        return _get_shared_github_client()
+    return GitHubClient(client_settings)
@@ -6,14 +6,64 @@ This module provides:
 - File: app.log with application logs (configurable level, default INFO)
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory, ProcessorFormatter
 
 
+# Attributes every LogRecord carries; anything else was set by us
+_STANDARD_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "taskName",
+}
+
+
+# Headers whose values are never written to the access log
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+
+# Whether access logs include headers and bodies; set by setup_logging
+_access_log_tracing = False
+
+# Writes queued records to the log files on a background thread
+_queue_listener: Optional[QueueListener] = None
+_queue_listener_running = False
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for JSONRenderer."""
+    return orjson.dumps(
+        obj,
+        default=kwargs.get("default"),
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+    ).decode()
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Queue records unchanged so the file handlers' formatters see them intact.
+
+    The default prepare() pre-formats the message and drops args/exc_info,
+    which would hide the structlog event dict from ProcessorFormatter.
+    While the listener is stopped (e.g. after shutdown) records are handled
+    synchronously so nothing is stranded in the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _queue_listener is not None and not _queue_listener_running:
+            _queue_listener.handle(record)
+        else:
+            super().emit(record)
+
+
 class AccessLogFilter(logging.Filter):
     """Filter to separate access logs from application logs."""
 
@@ -32,6 +82,14 @@ class AppLogFilter(logging.Filter):
         return not is_access
 
 
+class ExcludeLoggerFilter(logging.Filter):
+    """Filter that drops records from the named logger and its children."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Only allow records that the base name filter would reject."""
+        return not super().filter(record)
+
+
 def extract_log_record_attributes(
     logger: logging.Logger, method_name: str, event_dict: dict
 ) -> dict:
@@ -45,35 +103,13 @@ def extract_log_record_attributes(
     record = event_dict.get("_record")
     if record:
         # Extract all custom attributes from the record
-        for attr in dir(record):
-            if not attr.startswith("_") and attr not in (
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "getMessage",
-                "taskName",
+        for attr, value in record.__dict__.items():
+            if (
+                value is not None
+                and attr not in _STANDARD_RECORD_ATTRS
+                and not attr.startswith("_")
             ):
-                value = getattr(record, attr, None)
-                if value is not None and not callable(value):
-                    event_dict[attr] = value
+                event_dict[attr] = value
     return event_dict
 
 
@@ -98,6 +134,7 @@ def setup_logging(
 
     # ===== Shared Processors =====
     shared_processors = [
+        structlog.contextvars.merge_contextvars,  # Request-scoped fields
         extract_log_record_attributes,  # Extract LogRecord attrs to event_dict
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -115,8 +152,10 @@ def setup_logging(
 
     # ===== Configure Structlog =====
     structlog.configure(
-        processors=shared_processors
-        + [
+        processors=[
+            # Drop events below the logger's level before any other processing
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
             # Prepare event for standard library's ProcessorFormatter
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -132,7 +171,7 @@ def setup_logging(
     access_file_handler.addFilter(AccessLogFilter())
     access_file_handler.setFormatter(
         ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
+            processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             foreign_pre_chain=file_processors,
         )
     )
@@ -143,7 +182,7 @@ def setup_logging(
     app_file_handler.addFilter(AppLogFilter())
     app_file_handler.setFormatter(
         ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
+            processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
             foreign_pre_chain=file_processors,
         )
     )
@@ -154,6 +193,8 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.addFilter(AppLogFilter())
+    # SQLAlchemy gets its own WARNING-only console handler below
+    console_handler.addFilter(ExcludeLoggerFilter("sqlalchemy"))
     console_handler.setFormatter(
         ProcessorFormatter(
             processor=structlog.dev.ConsoleRenderer(),
@@ -161,15 +202,42 @@ def setup_logging(
         )
     )
 
+    # ===== Console Handler: stdout (SQLAlchemy, WARNING+) =====
+    sa_console = logging.StreamHandler(sys.stdout)
+    sa_console.setLevel(logging.WARNING)
+    sa_console.addFilter(logging.Filter("sqlalchemy"))
+    sa_console.setFormatter(console_handler.formatter)
+
+    # ===== Queue Writes Off the Calling Thread =====
+    # File and stdout writes block; records are queued and formatted/written
+    # by a listener thread so logging from request handlers never stalls the
+    # event loop.
+    global _queue_listener
+    stop_log_listener()
+    # Release the file handles of a previous setup_logging call
+    if _queue_listener is not None:
+        for old_handler in _queue_listener.handlers:
+            old_handler.close()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _PassthroughQueueHandler(log_queue)
+    _queue_listener = QueueListener(
+        log_queue,
+        console_handler,
+        sa_console,
+        access_file_handler,
+        app_file_handler,
+        respect_handler_level=True,
+    )
+    start_log_listener()
+
     # ===== Configure Root Logger =====
     root_logger = logging.getLogger()
-    root_logger.handlers = [
-        console_handler,  # App logs to stdout (visible via kubectl logs)
-        access_file_handler,  # Access logs to file
-        app_file_handler,  # App logs to file
-    ]
-    # Capture everything, handlers will filter
-    root_logger.setLevel(logging.DEBUG)
+    # App logs to stdout (visible via kubectl logs), access and app logs to
+    # files; all via the queue
+    root_logger.handlers = [queue_handler]
+    # Capture what at least one handler keeps (access logs are INFO); handlers
+    # filter further. This also lets filter_by_level drop the rest early.
+    root_logger.setLevel(min(numeric_level, logging.INFO))
 
     # ===== Silence Noisy Third-Party Loggers on Console =====
     # httpx logs every HTTP request at INFO level, which clutters console
@@ -183,7 +251,7 @@ def setup_logging(
     # We replace them with our handlers so all output is consistently formatted.
     for name in ("uvicorn", "uvicorn.error"):
         uv_logger = logging.getLogger(name)
-        uv_logger.handlers = [console_handler, app_file_handler]
+        uv_logger.handlers = [queue_handler]
         uv_logger.propagate = False
 
     # Suppress uvicorn.access entirely — our middleware handles access logging
@@ -197,10 +265,6 @@ def setup_logging(
     # and "sqlalchemy.pool". We set each logger to propagate=False and attach
     # our handlers directly so we can give the console WARNING-only while the
     # file handler respects LOG_LEVEL.
-    sa_console = logging.StreamHandler(sys.stdout)
-    sa_console.setLevel(logging.WARNING)
-    sa_console.setFormatter(console_handler.formatter)
-
     for _name in (
         "sqlalchemy.engine",
         "sqlalchemy.engine.Engine",
@@ -211,11 +275,33 @@ def setup_logging(
         _log = logging.getLogger(_name)
         _log.propagate = False
         _log.setLevel(numeric_level)  # file honours LOG_LEVEL
-        _log.addHandler(sa_console)  # console: WARNING+
-        _log.addHandler(app_file_handler)  # file: LOG_LEVEL+
+        # Via the queue: console WARNING+, file LOG_LEVEL+. Replaces the handler
+        # of any earlier call, whose queue is no longer drained.
+        _log.handlers = [queue_handler]
 
     # Store tracing setting for use in middleware
-    setattr(root_logger, "access_log_tracing", access_log_tracing)
+    global _access_log_tracing
+    _access_log_tracing = access_log_tracing
+
+
+def start_log_listener() -> None:
+    """Start writing queued log records to the log files, if not running."""
+    global _queue_listener_running
+    if _queue_listener is not None and not _queue_listener_running:
+        _queue_listener.start()
+        _queue_listener_running = True
+
+
+def stop_log_listener() -> None:
+    """Flush queued log records to the log files and stop the listener."""
+    global _queue_listener_running
+    if _queue_listener is not None and _queue_listener_running:
+        _queue_listener.stop()
+        _queue_listener_running = False
+
+
+# Flush anything still queued when the process exits
+atexit.register(stop_log_listener)
 
 
 def log_access(
@@ -223,7 +309,7 @@ def log_access(
     path: str,
     status_code: int,
     client: str | None = None,
-    headers: Dict[str, Any] | None = None,
+    headers: Mapping[str, Any] | None = None,
     request_body: str | None = None,
     response_body: str | None = None,
     duration_ms: float | None = None,
@@ -243,10 +329,8 @@ def log_access(
     """
     # Use standard library logger directly for access logs
     access_logger = logging.getLogger("access")
-
-    # Check if tracing is enabled
-    root_logger = logging.getLogger()
-    tracing_enabled = getattr(root_logger, "access_log_tracing", False)
+    if not access_logger.isEnabledFor(logging.INFO):
+        return
 
     # Build log data
     log_data: Dict[str, Any] = {
@@ -263,15 +347,13 @@ def log_access(
         log_data["duration_ms"] = round(duration_ms, 2)
 
     # Add tracing data if enabled
-    if tracing_enabled:
+    if _access_log_tracing:
         if headers:
             # Redact sensitive headers
-            sensitive = {"authorization", "cookie", "proxy-authorization"}
-            safe_headers = {
-                k: ("*****" if k.lower() in sensitive else v)
+            log_data["headers"] = {
+                k: ("*****" if k.lower() in _SENSITIVE_HEADERS else v)
                 for k, v in headers.items()
             }
-            log_data["headers"] = safe_headers
 
         if request_body:
             log_data["request_body"] = request_body
@@ -290,12 +372,9 @@ def log_access(
         None,
     )
 
-    # Mark as access log for filtering
-    record.is_access_log = True  # type: ignore[attr-defined]
-
-    # Add all log data as record attributes
-    # The extract_log_record_attributes processor will extract these
-    for key, value in log_data.items():
-        setattr(record, key, value)
+    # Mark as access log for filtering, and add all log data as record
+    # attributes; the extract_log_record_attributes processor extracts these
+    record.__dict__["is_access_log"] = True
+    record.__dict__.update(log_data)
 
     access_logger.handle(record)
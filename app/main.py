@@ -1,11 +1,16 @@
 """Main FastAPI application."""
 
 import asyncio
+import hashlib
 import json
+import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from app.worker import SyncWorker
@@ -13,7 +18,7 @@ if TYPE_CHECKING:
 from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+import orjson
 import structlog
 
 from app import __version__
@@ -24,17 +29,27 @@ from app.api.v1 import oauth_clients
 from app.api.v1 import runners
 from app.api.v1 import teams
 from app.api.v1 import webhooks
-from app.config import get_settings
+from app.config import settings
 from app.database import init_db, SessionLocal
-from app.logging_config import setup_logging, log_access
+from app.github.client import get_github_client
+from app.logging_config import (
+    log_access,
+    setup_logging,
+    start_log_listener,
+    stop_log_listener,
+)
 from app.schemas import ErrorResponse, HealthResponse
 from app.metrics import get_metrics
 
 current_file_path = Path(__file__).parent.resolve()
 favicon_path = current_file_path / "favicon.ico"
-
-# Get settings
-settings = get_settings()
+# Read once so favicon requests don't stat and open the file on the event loop
+_FAVICON_BYTES = favicon_path.read_bytes() if favicon_path.exists() else None
+_FAVICON_HEADERS = {"Cache-Control": "public, max-age=86400"}
+if _FAVICON_BYTES is not None:
+    _FAVICON_HEADERS["ETag"] = (
+        f'"{hashlib.blake2b(_FAVICON_BYTES, digest_size=8).hexdigest()}"'
+    )
 
 # Setup logging with new configuration
 setup_logging(
@@ -49,6 +64,12 @@ logger = structlog.get_logger()
 _sync_worker: Optional["SyncWorker"] = None
 _sync_task: Optional[asyncio.Task] = None
 
+# Default executor installed at startup, shut down with the application
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Seconds to wait for the cancelled sync task before shutting down anyway
+SYNC_SHUTDOWN_TIMEOUT = 5.0
+
 
 def get_sync_status(db=None) -> dict:
     """
@@ -107,6 +128,91 @@ def get_sync_status(db=None) -> dict:
             db.close()
 
 
+async def startup_event():
+    """Initialize application on startup."""
+    global _sync_worker, _sync_task, _executor
+
+    # Write queued file logs (restarts the listener after a previous shutdown)
+    start_log_listener()
+
+    # Bound the executor behind asyncio.to_thread (DB init, admin stats)
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 2) * 2),
+            thread_name_prefix="app-worker",
+        )
+    asyncio.get_running_loop().set_default_executor(_executor)
+
+    logger.info(
+        "application_starting", version=__version__, github_org=settings.github_org
+    )
+
+    # Initialize database off the event loop; schema creation blocks on I/O
+    try:
+        await asyncio.to_thread(init_db)
+        logger.info("database_initialized")
+    except Exception as e:
+        logger.exception("database_initialization_failed", error=str(e))
+        raise
+
+    # Start sync worker with leader election if enabled
+    if settings.sync_enabled:
+        from app.worker import SyncWorker
+
+        _sync_worker = SyncWorker()
+        _sync_task = asyncio.create_task(_sync_worker.start(), name="sync-worker")
+        logger.info(
+            "sync_worker_started",
+            leader_election_enabled=True,
+            note="Only one pod will become sync leader via PostgreSQL advisory lock",
+        )
+
+
+async def shutdown_event():
+    """Cleanup on shutdown."""
+    global _sync_worker, _sync_task, _executor
+
+    logger.info("application_shutting_down")
+
+    # Request graceful shutdown of sync worker
+    if _sync_worker is not None:
+        _sync_worker.request_shutdown()
+        logger.info("sync_worker_shutdown_requested")
+
+    # Cancel sync task if running
+    if _sync_task is not None:
+        _sync_task.cancel()
+        try:
+            # Don't let a sync stuck mid-request hold up shutdown
+            await asyncio.wait_for(_sync_task, timeout=SYNC_SHUTDOWN_TIMEOUT)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            logger.warning("sync_worker_shutdown_timeout")
+        logger.info("sync_worker_stopped")
+
+    # Release pooled GitHub API connections
+    await get_github_client().aclose()
+
+    # Let in-flight to_thread calls finish on their own; new ones are refused
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+    # Flush queued file logs
+    stop_log_listener()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run startup before serving requests and shutdown after."""
+    await startup_event()
+    try:
+        yield
+    finally:
+        await shutdown_event()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="GitHub Runner Token Service",
@@ -115,6 +221,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware only when cross-origin access is needed.
@@ -125,61 +232,78 @@ if settings.cors_allowed_origins:
         CORSMiddleware,
         allow_origins=settings.cors_allowed_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        # Explicit lists keep preflight checks to set lookups instead of
+        # reflecting whatever the browser asks for.
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+        allow_headers=["Authorization", "Content-Type"],
     )
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log HTTP requests with access logging."""
-    start_time = time.time()
+    start_time = time.perf_counter()
+    path = request.url.path
+
+    # Request-scoped fields merged into every structlog event for this request.
+    # They are cleared here rather than on exit so that general_exception_handler,
+    # which runs after this middleware unwinds, still logs them.
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(
+        method=request.method,
+        path=path,
+        request_id=uuid.uuid4().hex,
+    )
 
     try:
         response = await call_next(request)
 
         # Skip access logging for health checks to reduce noise
-        if request.url.path == "/health":
+        if path == "/health":
             return response
 
         # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
-        # Log access
+        # Log access; headers are passed as Starlette's read-only view and
+        # only read when tracing is enabled
         log_access(
             method=request.method,
-            path=request.url.path,
+            path=path,
             status_code=response.status_code,
             client=request.client.host if request.client else None,
-            headers=dict(request.headers),
+            headers=request.headers,
             duration_ms=duration_ms,
         )
 
         return response
 
     except Exception as e:
-        # Log the failure
-        duration_ms = (time.time() - start_time) * 1000
-        logger.exception(
-            "request_failed",
-            method=request.method,
-            path=request.url.path,
-            error=str(e),
-            duration_ms=duration_ms,
-        )
+        # Log the failure; the traceback is logged once, by
+        # general_exception_handler, which always sees the re-raised error
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.error("request_failed", error=str(e), duration_ms=duration_ms)
         raise
 
 
 # Exception handlers
+# Error bodies are constant, so they are serialized once at import
+_VALIDATION_ERROR_BODY = ErrorResponse(
+    detail="Validation error", error_code="VALIDATION_ERROR"
+).model_dump_json()
+_INTERNAL_ERROR_BODY = ErrorResponse(
+    detail="Internal server error", error_code="INTERNAL_ERROR"
+).model_dump_json()
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
     logger.warning("validation_error", path=request.url.path, errors=exc.errors())
-    return JSONResponse(
+    return Response(
+        content=_VALIDATION_ERROR_BODY,
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ErrorResponse(
-            detail="Validation error", error_code="VALIDATION_ERROR"
-        ).model_dump(),
+        media_type="application/json",
     )
 
 
@@ -187,67 +311,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.exception("unhandled_exception", path=request.url.path, error=str(exc))
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            detail="Internal server error", error_code="INTERNAL_ERROR"
-        ).model_dump(),
-    )
-
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    global _sync_worker, _sync_task
-
-    logger.info(
-        "application_starting", version=__version__, github_org=settings.github_org
+        media_type="application/json",
     )
 
-    # Initialize database
-    try:
-        init_db()
-        logger.info("database_initialized")
-    except Exception as e:
-        logger.exception("database_initialization_failed", error=str(e))
-        raise
-
-    # Start sync worker with leader election if enabled
-    if settings.sync_enabled:
-        from app.worker import SyncWorker
-
-        _sync_worker = SyncWorker()
-        _sync_task = asyncio.create_task(_sync_worker.start())
-        logger.info(
-            "sync_worker_started",
-            leader_election_enabled=True,
-            note="Only one pod will become sync leader via PostgreSQL advisory lock",
-        )
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    global _sync_worker, _sync_task
-
-    logger.info("application_shutting_down")
-
-    # Request graceful shutdown of sync worker
-    if _sync_worker is not None:
-        _sync_worker.request_shutdown()
-        logger.info("sync_worker_shutdown_requested")
-
-    # Cancel sync task if running
-    if _sync_task is not None:
-        _sync_task.cancel()
-        try:
-            await _sync_task
-        except asyncio.CancelledError:
-            pass
-        logger.info("sync_worker_stopped")
-
 
 # Health check endpoint (no auth required)
 @app.get("/health", response_model=HealthResponse, tags=["System"])
@@ -258,8 +327,18 @@ async def health_check():
     Returns service status and version information.
     No authentication required.
     """
-    return HealthResponse(
-        status="healthy", version=__version__, timestamp=datetime.now(timezone.utc)
+    # Serialized directly (bypassing response_model validation); the schema
+    # still documents the shape
+    return Response(
+        content=orjson.dumps(
+            {
+                "status": "healthy",
+                "version": __version__,
+                "timestamp": datetime.now(timezone.utc),
+            },
+            option=orjson.OPT_UTC_Z,
+        ),
+        media_type="application/json",
     )
 
 
@@ -275,24 +354,38 @@ async def metrics():
     return Response(content=metrics_data, media_type=content_type)
 
 
-# Root endpoint
-@app.get("/", tags=["System"])
-async def root():
-    """
-    Root endpoint with API information.
-    """
-    return {
+# Root endpoint; the payload is constant, so it is serialized once
+_ROOT_BODY = orjson.dumps(
+    {
         "service": "GitHub Runner Token Service",
         "version": __version__,
         "docs": "/docs",
         "health": "/health",
         "metrics": "/metrics",
     }
+)
+
+
+@app.get("/", tags=["System"])
+async def root():
+    """
+    Root endpoint with API information.
+    """
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/favicon.ico", include_in_schema=False)
-async def favicon():
-    return FileResponse(favicon_path)
+async def favicon(request: Request):
+    if _FAVICON_BYTES is None:
+        return Response(status_code=404)
+    # Revalidation after max-age is answered without a body
+    if request.headers.get("if-none-match") == _FAVICON_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_FAVICON_HEADERS)
+    return Response(
+        content=_FAVICON_BYTES,
+        media_type="image/x-icon",
+        headers=_FAVICON_HEADERS,
+    )
 
 
 app.include_router(runners.router, prefix="/api/v1")
@@ -308,6 +401,8 @@ app.include_router(webhooks.router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
     # Build uvicorn config
@@ -318,8 +413,13 @@ if __name__ == "__main__":
         "reload": True,
         "log_level": settings.log_level.lower(),
         "access_log": True,  # Enable uvicorn's access logs on console
+        "http": "httptools",
     }
 
+    # uvloop (from uvicorn[standard]) is not available on Windows
+    if sys.platform != "win32":
+        uvicorn_config["loop"] = "uvloop"
+
     # Add HTTPS configuration if enabled
     if settings.https_enabled:
         if not settings.https_cert_file or not settings.https_key_file:
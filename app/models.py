@@ -3,6 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
+import orjson
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
@@ -13,6 +14,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 
 from app.database import Base
@@ -67,11 +69,34 @@ class Runner(Base):
 
     # Indexes
     __table_args__ = (
-        Index("ix_runners_status_created", "status", "created_at"),
         Index("ix_runners_provisioned_by_status", "provisioned_by", "status"),
         Index("ix_runners_team_status", "team_id", "status"),
+        # Age scans over runners that have not settled yet, e.g. the expired
+        # JIT config cleanup (status = 'pending' AND created_at < cutoff).
+        # Partial, so offline and deleted rows never enter it.
+        Index(
+            "ix_runners_active",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'active')"),
+            sqlite_where=text("status IN ('pending', 'active')"),
+        ),
     )
 
+    @property
+    def label_list(self) -> list[str]:
+        """
+        Decoded ``labels`` JSON, cached until the column value changes.
+
+        The decoded labels are cached as a tuple and each call returns a new
+        list, so callers may modify the result freely.
+        """
+        raw = self.labels
+        cached = self.__dict__.get("_label_list_cache")
+        if cached is None or cached[0] is not raw:
+            cached = (raw, tuple(orjson.loads(raw)) if raw else ())
+            self.__dict__["_label_list_cache"] = cached
+        return list(cached[1])
+
 
 class AuditLog(Base):
     """Audit log for all operations."""
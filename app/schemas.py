@@ -1,9 +1,17 @@
 """Pydantic schemas for API request/response models."""
 
+import re
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Runner names and labels: letters, digits, hyphens and underscores, with at
+# least one letter or digit
+_IDENT_RE = re.compile(r"\A(?=[\w-]*[^\W_])[\w-]+\Z")
+
+# Kebab-case team names; also enforced by TeamService.create_team
+TEAM_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
 
 
 class RunnerStatus(BaseModel):
@@ -134,7 +142,7 @@ class JitProvisionRequest(BaseModel):
     @classmethod
     def validate_runner_name(cls, v: Optional[str]) -> Optional[str]:
         """Validate runner name format."""
-        if v is not None and not v.replace("-", "").replace("_", "").isalnum():
+        if v is not None and not _IDENT_RE.match(v):
             raise ValueError(
                 "Runner name must contain only alphanumeric, hyphens, and underscores"
             )
@@ -144,13 +152,14 @@ class JitProvisionRequest(BaseModel):
     @classmethod
     def validate_runner_name_prefix(cls, v: Optional[str]) -> Optional[str]:
         """Validate runner name prefix format."""
-        if v is not None and not v.replace("-", "").replace("_", "").isalnum():
+        if v is not None and not _IDENT_RE.match(v):
             raise ValueError(
                 "Runner name prefix must contain only alphanumeric, hyphens, and underscores"
             )
         return v
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_runner_name_choice(self) -> "JitProvisionRequest":
         """Validate that either runner_name or runner_name_prefix is provided, but not both."""
         if self.runner_name is None and self.runner_name_prefix is None:
             raise ValueError(
@@ -160,13 +169,15 @@ class JitProvisionRequest(BaseModel):
             raise ValueError(
                 "Only one of 'runner_name' or 'runner_name_prefix' can be provided, not both"
             )
+        return self
 
     @field_validator("labels")
     @classmethod
     def validate_labels(cls, v: List[str]) -> List[str]:
         """Validate labels format."""
+        match = _IDENT_RE.match
         for label in v:
-            if not label.replace("-", "").replace("_", "").isalnum():
+            if not match(label):
                 raise ValueError(
                     f"Label '{label}' must contain only alphanumeric, hyphens, and underscores"
                 )
@@ -233,12 +244,14 @@ class UserCreate(BaseModel):
         description="Team IDs to add the user to on creation",
     )
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_identity_and_teams(self) -> "UserCreate":
         """Validate that at least one identifier is provided."""
         if not self.email and not self.oidc_sub:
             raise ValueError("Either 'email' or 'oidc_sub' must be provided")
         if not self.is_admin and not self.team_ids:
             raise ValueError("Non-admin users must belong to at least one team")
+        return self
 
 
 class UserUpdate(BaseModel):
@@ -380,12 +393,14 @@ class BatchDeleteRunnersRequest(BatchActionRequest):
         description="Specific runner IDs to delete. Takes precedence over user_identity.",
     )
 
-    def model_post_init(self, __context) -> None:
+    @model_validator(mode="after")
+    def validate_target(self) -> "BatchDeleteRunnersRequest":
         """Require targeting field to prevent fleet-wide deletion."""
         if not self.runner_ids and not self.user_identity:
             raise ValueError(
                 "At least one of 'runner_ids' or 'user_identity' must be provided"
             )
+        return self
 
 
 class BatchDeactivateTeamsRequest(BatchActionRequest):
@@ -461,9 +476,7 @@ class TeamCreate(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate team name is kebab-case."""
-        import re
-
-        if not re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$", v):
+        if not TEAM_NAME_RE.match(v):
             raise ValueError(
                 "Team name must be kebab-case (lowercase, alphanumeric, hyphens)"
             )
@@ -2,7 +2,9 @@
 
 import json
 import re
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Set
 
 from sqlalchemy.orm import Session
 
@@ -17,6 +19,101 @@ class LabelPolicyViolation(Exception):
         self.invalid_labels = invalid_labels
 
 
+@lru_cache(maxsize=1024)
+def compile_label_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """
+    Compile a team's optional label patterns, cached across requests.
+
+    Invalid patterns are skipped, matching how enforcement has always treated
+    them.
+
+    Args:
+        patterns: Regex patterns as stored on the team
+
+    Returns:
+        Compiled patterns, in order
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern))
+        except re.error:
+            continue
+    return tuple(compiled)
+
+
+# Numbered backreferences and conditional groups would point at the wrong
+# group once patterns are joined into one alternation.
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?\(")
+
+
+def combine_label_patterns(
+    compiled: tuple[re.Pattern[str], ...],
+) -> tuple[re.Pattern[str], ...]:
+    """
+    Fuse compiled label patterns into a single alternation where possible.
+
+    ``combined.match(label)`` succeeds exactly when one of the original
+    patterns would, so callers keep the per-pattern ``re.match`` semantics.
+    Pattern sets that cannot be fused safely (numbered backreferences,
+    conditional groups, duplicate group names, inline global flags) are
+    returned unchanged.
+
+    Args:
+        compiled: Compiled patterns, as returned by compile_label_patterns
+
+    Returns:
+        A one-element tuple holding the fused pattern, or the input patterns
+    """
+    if len(compiled) < 2 or any(
+        _GROUP_REFERENCE_RE.search(p.pattern) for p in compiled
+    ):
+        return compiled
+    try:
+        return (re.compile("|".join(f"(?:{p.pattern})" for p in compiled)),)
+    except re.error:
+        return compiled
+
+
+@dataclass(frozen=True)
+class TeamLabelPolicy:
+    """Decoded label policy of a team, shared between requests."""
+
+    required_labels: tuple[str, ...]
+    optional_patterns: tuple[str, ...]
+    label_matchers: tuple[re.Pattern[str], ...]
+
+    def allows(self, label: str) -> bool:
+        """Return True if the label matches one of the optional patterns."""
+        return any(matcher.match(label) for matcher in self.label_matchers)
+
+
+@lru_cache(maxsize=1024)
+def parse_team_label_policy(
+    required_labels_json: str, optional_patterns_json: Optional[str]
+) -> TeamLabelPolicy:
+    """
+    Decode a team's stored label policy, cached by the raw column values.
+
+    Keying on the stored JSON means an updated policy is simply a cache miss.
+
+    Args:
+        required_labels_json: Team.required_labels column value
+        optional_patterns_json: Team.optional_label_patterns column value
+
+    Returns:
+        Decoded required labels and patterns, with the patterns compiled
+    """
+    patterns = (
+        tuple(json.loads(optional_patterns_json)) if optional_patterns_json else ()
+    )
+    return TeamLabelPolicy(
+        required_labels=tuple(json.loads(required_labels_json)),
+        optional_patterns=patterns,
+        label_matchers=combine_label_patterns(compile_label_patterns(patterns)),
+    )
+
+
 class LabelPolicyService:
     """Service for enforcing team-based label policies on runner provisioning."""
 
@@ -106,7 +203,7 @@ class LabelPolicyService:
         return event
 
     def validate_labels_for_team(
-        self, team_id: str, requested_labels: List[str]
+        self, team_id: str, requested_labels: Sequence[str]
     ) -> None:
         """
         Validate requested labels against team's policy.
@@ -132,15 +229,11 @@ class LabelPolicyService:
         if not team.is_active:
             raise ValueError(f"Team '{team.name}' is not active")
 
-        # Parse required labels from JSON
-        required_labels = set(json.loads(team.required_labels))
-
-        # Parse optional label patterns if configured
-        optional_patterns = (
-            json.loads(team.optional_label_patterns)
-            if team.optional_label_patterns
-            else []
+        policy = parse_team_label_policy(
+            team.required_labels, team.optional_label_patterns
         )
+        required_labels = set(policy.required_labels)
+        optional_patterns = list(policy.optional_patterns)
 
         # Filter out system labels - they are always allowed
         user_labels = [
@@ -163,18 +256,7 @@ class LabelPolicyService:
                 continue
 
             # Check optional pattern match
-            matched = False
-            if optional_patterns:
-                for pattern in optional_patterns:
-                    try:
-                        if re.match(pattern, label):
-                            matched = True
-                            break
-                    except re.error:
-                        # Invalid regex pattern - log and skip
-                        continue
-
-            if not matched:
+            if not policy.allows(label):
                 invalid_labels.add(label)
 
         if invalid_labels:
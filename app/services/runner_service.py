@@ -11,7 +11,7 @@ from sqlalchemy.orm import Session
 
 from app.auth.dependencies import AuthenticatedUser
 from app.config import Settings
-from app.github.client import GitHubClient
+from app.github.client import get_github_client
 from app.models import AuditLog, Runner, Team
 from app.schemas import (
     JitProvisionRequest,
@@ -30,7 +30,7 @@ class RunnerService:
     def __init__(self, settings: Settings, db: Session):
         self.settings = settings
         self.db = db
-        self.github = GitHubClient(settings)
+        self.github = get_github_client(settings)
 
     def _generate_unique_runner_name(self, prefix: str) -> str:
         """
@@ -1,15 +1,15 @@
 """GitHub runner synchronization service."""
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 import structlog
 from sqlalchemy.orm import Session
 
 from app.config import Settings
-from app.github.client import GitHubClient, GitHubRunnerInfo
+from app.github.client import GitHubRunnerInfo, get_github_client
 from app.metrics import runner_state_transitions_total, runners_by_status
 from app.models import Runner
 from app.services.label_policy_service import LabelPolicyService
@@ -65,7 +65,7 @@ class SyncService:
     def __init__(self, settings: Settings, db: Session):
         self.settings = settings
         self.db = db
-        self.github = GitHubClient(settings)
+        self.github = get_github_client(settings)
         self.label_policy_service = LabelPolicyService(db)
 
     async def sync_all_runners(self) -> SyncResult:
@@ -86,7 +86,9 @@ class SyncService:
 
         result = SyncResult()
 
-        # Get all non-deleted local runners
+        # Get all non-deleted local runners. All ORM work stays on the calling
+        # thread: the Session is not shared with executor threads, and label
+        # drift handling interleaves GitHub calls with database writes.
         local_runners = self.db.query(Runner).filter(Runner.status != "deleted").all()
 
         if not local_runners:
@@ -325,8 +327,8 @@ class SyncService:
 
         # Parse original labels
         try:
-            original_labels = set(json.loads(runner.labels))
-        except (json.JSONDecodeError, TypeError):
+            original_labels = set(runner.label_list)
+        except (orjson.JSONDecodeError, TypeError):
             logger.warning(
                 "invalid_runner_labels",
                 runner_id=runner.id,
@@ -1,7 +1,6 @@
 """Team management and authorization service."""
 
 import json
-import re
 from datetime import datetime, timezone
 from typing import List, Optional, Set, Tuple
 
@@ -9,6 +8,8 @@ from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.models import Runner, Team, User, UserTeamMembership
+from app.schemas import TEAM_NAME_RE
+from app.services.label_policy_service import parse_team_label_policy
 
 
 class TeamPolicyViolation(Exception):
@@ -65,7 +66,7 @@ class TeamService:
             ValueError: If team name already exists or is invalid
         """
         # Validate team name format (kebab-case)
-        if not re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$", name):
+        if not TEAM_NAME_RE.match(name):
             raise ValueError(
                 "Team name must be kebab-case (lowercase, alphanumeric, hyphens)"
             )
@@ -418,20 +419,15 @@ class TeamService:
         if not team.is_active:
             raise ValueError(f"Team '{team.name}' is deactivated")
 
-        # Parse required labels
-        required_labels = json.loads(team.required_labels)
+        policy = parse_team_label_policy(
+            team.required_labels, team.optional_label_patterns
+        )
+        required_labels = list(policy.required_labels)
 
         # If no optional labels requested, return required labels only
         if not optional_labels:
             return required_labels, set()
 
-        # Parse optional label patterns
-        patterns = (
-            json.loads(team.optional_label_patterns)
-            if team.optional_label_patterns
-            else []
-        )
-
         # Filter out system labels from validation
         user_optional_labels = [
             label for label in optional_labels if label not in self.SYSTEM_LABELS
@@ -443,18 +439,9 @@ class TeamService:
 
         for label in user_optional_labels:
             # Check if label matches any pattern
-            matched = False
-            for pattern in patterns:
-                try:
-                    if re.match(pattern, label):
-                        matched = True
-                        valid_optional_labels.append(label)
-                        break
-                except re.error:
-                    # Invalid regex pattern - skip
-                    continue
-
-            if not matched:
+            if policy.allows(label):
+                valid_optional_labels.append(label)
+            else:
                 invalid_labels.add(label)
 
         # If there are invalid labels, raise violation
@@ -72,6 +72,8 @@ class SyncWorker:
         self.is_leader = False
         self.pg_conn: Optional[asyncpg.Connection] = None
         self.shutdown_requested = False
+        # Set on shutdown so interval waits end immediately
+        self._shutdown_event = asyncio.Event()
 
     async def start(self):
         """Start the sync worker with leader election."""
@@ -98,8 +100,9 @@ class SyncWorker:
             )
             raise
 
-        # Initialize sync_state record on startup
-        self._initialize_sync_state()
+        # Initialize sync_state record on startup (blocking ORM work runs in a
+        # thread so the API's event loop keeps serving when run in-process)
+        await asyncio.to_thread(self._initialize_sync_state)
 
         try:
             await self._run_with_leader_election()
@@ -118,7 +121,7 @@ class SyncWorker:
             try:
                 # Guard against missing connection after failed reconnect
                 if self.pg_conn is None:
-                    await asyncio.sleep(backoff_seconds)
+                    await self._pause(backoff_seconds)
                     backoff_seconds = min(backoff_seconds * 2, max_backoff)
                     continue
 
@@ -150,7 +153,7 @@ class SyncWorker:
                     # Skip sleep on first cycle if sync_on_startup is enabled
                     if first_cycle and not self.settings.sync_on_startup:
                         first_cycle = False
-                        await asyncio.sleep(self.settings.sync_interval_seconds)
+                        await self._pause(self.settings.sync_interval_seconds)
                         continue
 
                     first_cycle = False
@@ -176,7 +179,7 @@ class SyncWorker:
 
                     first_cycle = False
                     logger.debug("sync_standby", hostname=self.hostname)
-                    await asyncio.sleep(self.settings.sync_interval_seconds)
+                    await self._pause(self.settings.sync_interval_seconds)
                     # Reset backoff on successful standby cycle
                     backoff_seconds = 10
 
@@ -197,12 +200,12 @@ class SyncWorker:
                 )
                 sync_errors_total.labels(error_type="reconnect_exhausted").inc()
                 # Use exponential backoff for outer loop
-                await asyncio.sleep(backoff_seconds)
+                await self._pause(backoff_seconds)
                 backoff_seconds = min(backoff_seconds * 2, max_backoff)
             except Exception as e:
                 logger.error("sync_worker_error", error=str(e), hostname=self.hostname)
                 sync_errors_total.labels(error_type="worker_error").inc()
-                await asyncio.sleep(backoff_seconds)
+                await self._pause(backoff_seconds)
                 backoff_seconds = min(backoff_seconds * 2, max_backoff)
 
     @retry(
@@ -236,48 +239,45 @@ class SyncWorker:
 
     async def _run_sync_cycle(self):
         """Execute a single sync cycle as leader."""
-        db = SessionLocal()
         start_time = time.time()
 
-        try:
-            # Update heartbeat
-            self._update_heartbeat(db)
+        with SessionLocal() as db:
+            try:
+                # Update heartbeat
+                await asyncio.to_thread(self._update_heartbeat, db)
 
-            # Run sync with timing
-            sync_service = SyncService(self.settings, db)
-            result = await sync_service.sync_all_runners()
+                # Run sync with timing
+                sync_service = SyncService(self.settings, db)
+                result = await sync_service.sync_all_runners()
 
-            # Record sync duration
-            duration = time.time() - start_time
-            sync_duration_seconds.observe(duration)
+                # Record sync duration
+                duration = time.time() - start_time
+                sync_duration_seconds.observe(duration)
 
-            # Update metrics
-            sync_runners_updated.inc(result.updated)
-            sync_runners_deleted.inc(result.deleted)
-            sync_runners_unchanged.inc(result.unchanged)
-            sync_last_success_timestamp.set(time.time())
+                # Update metrics
+                sync_runners_updated.inc(result.updated)
+                sync_runners_deleted.inc(result.deleted)
+                sync_runners_unchanged.inc(result.unchanged)
+                sync_last_success_timestamp.set(time.time())
 
-            # Store result in database
-            self._store_sync_result(db, result)
+                # Store result in database
+                await asyncio.to_thread(self._store_sync_result, db, result)
 
-            logger.info("sync_cycle_completed", **result.to_dict())
+                logger.info("sync_cycle_completed", **result.to_dict())
 
-            # Sleep until next cycle
-            await asyncio.sleep(self.settings.sync_interval_seconds)
+            except SyncError as e:
+                logger.error("sync_error", error=str(e))
+                sync_errors_total.labels(error_type="sync_error").inc()
+                await asyncio.to_thread(self._store_sync_error, db, str(e))
+                # Continue running despite sync errors
+            except Exception as e:
+                logger.error("sync_cycle_error", error=str(e))
+                sync_errors_total.labels(error_type="sync_cycle_error").inc()
+                await asyncio.to_thread(self._store_sync_error, db, str(e))
 
-        except SyncError as e:
-            logger.error("sync_error", error=str(e))
-            sync_errors_total.labels(error_type="sync_error").inc()
-            self._store_sync_error(db, str(e))
-            # Continue running despite sync errors
-            await asyncio.sleep(self.settings.sync_interval_seconds)
-        except Exception as e:
-            logger.error("sync_cycle_error", error=str(e))
-            sync_errors_total.labels(error_type="sync_cycle_error").inc()
-            self._store_sync_error(db, str(e))
-            await asyncio.sleep(self.settings.sync_interval_seconds)
-        finally:
-            db.close()
+        # Sleep until next cycle; the session is closed so no pooled
+        # connection is held between cycles
+        await self._pause(self.settings.sync_interval_seconds)
 
     def _initialize_sync_state(self):
         """Initialize sync_state record on worker startup."""
@@ -364,13 +364,26 @@ class SyncWorker:
         """Request graceful shutdown (finish current cycle)."""
         logger.info("shutdown_requested", hostname=self.hostname)
         self.shutdown_requested = True
+        self._shutdown_event.set()
+
+    async def _pause(self, seconds: float) -> None:
+        """Wait for the given time, returning early if shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
 
 async def main():
     """Entry point for sync worker."""
     from app.logging_config import setup_logging
 
-    setup_logging()
+    settings = get_settings()
+    setup_logging(
+        log_level=settings.log_level,
+        log_dir=settings.log_dir,
+        access_log_tracing=settings.access_log_tracing,
+    )
 
     worker = SyncWorker()
 
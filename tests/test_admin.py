@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.auth.dependencies import AuthenticatedUser
-from app.models import SecurityEvent
+from app.models import Runner, SecurityEvent
 
 
 class TestAdminRoleChecking:
@@ -107,3 +107,35 @@ class TestSecurityEventsEndpoints:
         data = response.json()
         for event in data["events"]:
             assert event["severity"] == "high"
+
+
+class TestAdminStats:
+    """Tests for the admin stats endpoint."""
+
+    def test_runner_counts_by_status(
+        self, client: TestClient, test_db: Session, admin_auth_override
+    ):
+        """Test runner totals and per-status counts exclude deleted runners."""
+        statuses = ["active", "active", "offline", "pending", "deleted"]
+        for i, runner_status in enumerate(statuses):
+            test_db.add(
+                Runner(
+                    runner_name=f"stats-runner-{i}",
+                    runner_group_id=1,
+                    labels=json.dumps(["test"]),
+                    provisioned_by="admin@example.com",
+                    status=runner_status,
+                    github_url="https://github.com/test-org",
+                )
+            )
+        test_db.commit()
+
+        response = client.get("/api/v1/admin/stats")
+        assert response.status_code == 200
+
+        assert response.json()["runners"] == {
+            "total": 4,
+            "active": 2,
+            "offline": 1,
+            "pending": 1,
+        }
@@ -1,7 +1,11 @@
 """Tests for basic API endpoints (health, root, docs)."""
 
+from unittest.mock import patch
+
+import structlog
 from fastapi.testclient import TestClient
 
+import app.main as app_main
 from app.main import app
 
 client = TestClient(app)
@@ -29,6 +33,63 @@ class TestHealthEndpoints:
         assert data["service"] == "GitHub Runner Token Service"
         assert "version" in data
 
+    def test_favicon(self):
+        """Test favicon is served from memory with caching headers."""
+        response = client.get("/favicon.ico")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/x-icon"
+        assert "max-age" in response.headers["cache-control"]
+        assert response.content == app_main.favicon_path.read_bytes()
+
+    def test_favicon_not_modified(self):
+        """Test favicon revalidation with a matching ETag returns 304."""
+        etag = client.get("/favicon.ico").headers["etag"]
+
+        response = client.get("/favicon.ico", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+
+class TestErrorLogging:
+    """Tests for logging of unhandled request errors."""
+
+    def test_unhandled_exception_log_carries_request_id(self):
+        """Test that the traceback log can be matched to request_failed."""
+        error_client = TestClient(app, raise_server_exceptions=False)
+
+        with (
+            patch.object(app_main, "datetime") as mock_datetime,
+            structlog.testing.capture_logs(
+                processors=[structlog.contextvars.merge_contextvars]
+            ) as logs,
+        ):
+            mock_datetime.now.side_effect = RuntimeError("boom")
+            response = error_client.get("/health")
+
+        assert response.status_code == 500
+        events = {log["event"]: log for log in logs}
+        failed = events["request_failed"]
+        unhandled = events["unhandled_exception"]
+        assert unhandled["request_id"] == failed["request_id"]
+        assert unhandled["method"] == "GET"
+        assert unhandled["path"] == "/health"
+
+
+class TestLifespan:
+    """Tests for application startup and shutdown."""
+
+    def test_default_executor_shut_down(self):
+        """Test that each lifespan cycle releases its thread pool."""
+        with TestClient(app):
+            first = app_main._executor
+            assert first is not None
+
+        assert app_main._executor is None
+        assert first._shutdown
+
+        with TestClient(app):
+            assert app_main._executor is not first
+
 
 class TestDocumentation:
     """Tests for API documentation endpoints."""
@@ -1,5 +1,8 @@
 """Tests for batch admin operations."""
 
+from unittest.mock import AsyncMock, patch
+
+import httpx
 from sqlalchemy.orm import Session
 
 from app.models import Runner, SecurityEvent
@@ -453,6 +456,57 @@ class TestBatchDeleteRunners:
         assert event is not None
         assert "Audit test: deleting runner" in event.violation_data
 
+    def test_batch_delete_github_failure_reported(
+        self, client, admin_auth_override, test_db: Session
+    ):
+        """Test that runners GitHub failed to delete are not marked deleted."""
+        deleted = Runner(
+            runner_name="github-deleted",
+            runner_group_id=1,
+            labels="[]",
+            provisioned_by="test@example.com",
+            status="active",
+            github_runner_id=101,
+            github_url="https://github.com/test-org",
+        )
+        stuck = Runner(
+            runner_name="github-stuck",
+            runner_group_id=1,
+            labels="[]",
+            provisioned_by="test@example.com",
+            status="active",
+            github_runner_id=102,
+            github_url="https://github.com/test-org",
+        )
+        test_db.add_all([deleted, stuck])
+        test_db.commit()
+
+        async def delete_runners(ids):
+            return [
+                True if i == 101 else httpx.ConnectError("unreachable") for i in ids
+            ]
+
+        github = AsyncMock()
+        github.delete_runners = AsyncMock(side_effect=delete_runners)
+        with patch("app.github.client.get_github_client", return_value=github):
+            response = client.post(
+                "/api/v1/admin/batch/delete-runners",
+                json={
+                    "comment": "Cleanup: removing test runners",
+                    "runner_ids": [deleted.id, stuck.id],
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert data["affected_count"] == 1
+        assert data["failed_count"] == 1
+        test_db.refresh(deleted)
+        test_db.refresh(stuck)
+        assert deleted.status == "deleted"
+        assert stuck.status == "active"
+
     def test_batch_delete_empty_result(
         self, client, admin_auth_override, test_db: Session
     ):
@@ -0,0 +1,456 @@
+"""Tests for the GitHub API client and GitHub App authentication."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import jwt
+import orjson
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.github.app_auth import GitHubAppAuth, parse_github_timestamp
+from app.github.client import GitHubClient, GitHubRunnerInfo
+
+
+@pytest.fixture(scope="module")
+def rsa_private_key():
+    """Generate an RSA key for signing test JWTs."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def app_auth(mock_settings, rsa_private_key):
+    """GitHubAppAuth configured with a valid RSA private key."""
+    mock_settings.github_app_private_key = rsa_private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    return GitHubAppAuth(mock_settings)
+
+
+class TestParseGitHubTimestamp:
+    """Tests for parsing GitHub API timestamps."""
+
+    def test_github_format(self):
+        """Test the fixed-width UTC format GitHub returns."""
+        assert parse_github_timestamp("2024-03-05T07:08:09Z") == datetime(
+            2024, 3, 5, 7, 8, 9, tzinfo=timezone.utc
+        )
+
+    def test_other_iso_formats_fall_back(self):
+        """Test that offsets and fractional seconds are still accepted."""
+        parsed = parse_github_timestamp("2024-03-05T08:08:09.5+01:00")
+
+        assert parsed == datetime(2024, 3, 5, 7, 8, 9, 500000, tzinfo=timezone.utc)
+
+
+class TestGenerateJwt:
+    """Tests for GitHub App JWT generation."""
+
+    def test_jwt_is_signed_with_app_key(self, app_auth, rsa_private_key):
+        """Test that the JWT verifies against the app's public key."""
+        token = app_auth._generate_jwt()
+
+        claims = jwt.decode(token, rsa_private_key.public_key(), algorithms=["RS256"])
+        assert claims["iss"] == "12345"
+        assert claims["exp"] - claims["iat"] == 660
+
+    def test_signing_key_parsed_once(self, app_auth):
+        """Test that the PEM is parsed once and the key object reused."""
+        app_auth._generate_jwt()
+        key = app_auth._signing_key
+
+        app_auth._generate_jwt()
+
+        assert key is not None
+        assert app_auth._signing_key is key
+
+    def test_jwt_reused_until_near_expiry(self, app_auth):
+        """Test that the cached JWT is reused and re-minted near expiry."""
+        first = app_auth._generate_jwt()
+        assert app_auth._generate_jwt() == first
+
+        # Within 60 seconds of expiry a new JWT must be minted
+        near_expiry = int(time.time()) + 30
+        app_auth._jwt_exp = near_expiry
+        app_auth._generate_jwt()
+        assert app_auth._jwt_exp > near_expiry
+
+
+def _token_http_client(token: str = "ghs_new") -> AsyncMock:
+    """Mock HTTP client answering the installation access_tokens endpoint."""
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    response = MagicMock()
+    response.content = orjson.dumps(
+        {"token": token, "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")}
+    )
+    client = AsyncMock()
+    client.post = AsyncMock(return_value=response)
+    return client
+
+
+class TestInstallationToken:
+    """Tests for installation token caching and refresh."""
+
+    @pytest.mark.asyncio
+    async def test_valid_token_served_from_cache(self, app_auth):
+        """Test that a token far from expiry is returned without a request."""
+        http_client = _token_http_client()
+        app_auth.get_http_client = AsyncMock(return_value=http_client)
+        app_auth._installation_token = "ghs_cached"
+        app_auth._token_expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        assert await app_auth.get_installation_token() == "ghs_cached"
+        http_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_expiring_token_refreshed_in_background(self, app_auth):
+        """Test that a soon-to-expire token is served while refreshing."""
+        http_client = _token_http_client()
+        app_auth.get_http_client = AsyncMock(return_value=http_client)
+        app_auth._installation_token = "ghs_cached"
+        app_auth._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=8)
+
+        assert await app_auth.get_installation_token() == "ghs_cached"
+
+        await app_auth._refresh_task
+        assert app_auth._installation_token == "ghs_new"
+        http_client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_refreshed_inline(self, app_auth):
+        """Test that a token close to expiry is refreshed before returning."""
+        http_client = _token_http_client()
+        app_auth.get_http_client = AsyncMock(return_value=http_client)
+        app_auth._installation_token = "ghs_cached"
+        app_auth._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+        assert await app_auth.get_installation_token() == "ghs_new"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(self, app_auth):
+        """Test that concurrent callers share a single token request."""
+        http_client = _token_http_client()
+        response = http_client.post.return_value
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        http_client.post.side_effect = slow_post
+        app_auth.get_http_client = AsyncMock(return_value=http_client)
+
+        tokens = await asyncio.gather(
+            *(app_auth.get_installation_token() for _ in range(5))
+        )
+
+        assert tokens == ["ghs_new"] * 5
+        http_client.post.assert_called_once()
+
+
+class TestSharedHttpClient:
+    """Tests for the pooled HTTP client shared by GitHub API calls."""
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self, mock_settings):
+        """Test that repeated calls return the same pooled client."""
+        auth = GitHubAppAuth(mock_settings)
+
+        first = await auth.get_http_client()
+        second = await auth.get_http_client()
+
+        assert first is second
+        await auth.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_client(self, mock_settings):
+        """Test that aclose closes the client and a new one is created after."""
+        auth = GitHubAppAuth(mock_settings)
+
+        first = await auth.get_http_client()
+        await auth.aclose()
+
+        assert first.is_closed
+        second = await auth.get_http_client()
+        assert second is not first
+        await auth.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_sends_api_headers(self, mock_settings):
+        """Test that Accept and API version headers are set on the client."""
+        auth = GitHubAppAuth(mock_settings)
+
+        client = await auth.get_http_client()
+
+        assert client.headers["Accept"] == "application/vnd.github+json"
+        assert client.headers["X-GitHub-Api-Version"] == "2022-11-28"
+        await auth.aclose()
+
+
+@pytest.fixture
+def github_client(mock_settings):
+    """GitHubClient with authentication and HTTP transport mocked out."""
+    client = GitHubClient(mock_settings)
+    client.auth = MagicMock()
+    client.auth.get_authenticated_headers = AsyncMock(return_value={})
+    client.auth.get_http_client = AsyncMock()
+    return client
+
+
+def _runners_response(
+    *runners: tuple[int, str], total_count: Optional[int] = None
+) -> MagicMock:
+    """Mock response for the list runners endpoint."""
+    response = MagicMock()
+    response.content = orjson.dumps(
+        {
+            "total_count": len(runners) if total_count is None else total_count,
+            "runners": [
+                {"id": runner_id, "name": name, "status": "online", "labels": []}
+                for runner_id, name in runners
+            ],
+        }
+    )
+    return response
+
+
+class TestGitHubRunnerInfo:
+    """Tests for parsing runner objects from the GitHub API."""
+
+    def test_from_api(self):
+        """Test that API fields and label names are extracted."""
+        runner = GitHubRunnerInfo.from_api(
+            {
+                "id": 7,
+                "name": "runner-a",
+                "os": "linux",
+                "status": "online",
+                "busy": True,
+                "labels": [{"id": 1, "name": "self-hosted"}, {"id": 2, "name": "x64"}],
+            }
+        )
+
+        assert runner == GitHubRunnerInfo(
+            id=7,
+            name="runner-a",
+            os="linux",
+            status="online",
+            busy=True,
+            labels=("self-hosted", "x64"),
+        )
+
+    def test_from_api_defaults(self):
+        """Test that optional fields default when absent."""
+        runner = GitHubRunnerInfo.from_api({"id": 7, "name": "runner-a"})
+
+        assert runner.busy is False
+        assert runner.labels == ()
+        assert not hasattr(runner, "__dict__")
+
+
+class TestListRunners:
+    """Tests for listing organization runners."""
+
+    @pytest.mark.asyncio
+    async def test_single_page(self, github_client):
+        """Test that one request is made when all runners fit on a page."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=_runners_response((1, "runner-a")))
+        github_client.auth.get_http_client.return_value = http_client
+
+        runners = await github_client.list_runners()
+
+        assert [r.name for r in runners] == ["runner-a"]
+        http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages(self, github_client):
+        """Test that every page reported by total_count is fetched."""
+        pages = {
+            1: _runners_response((1, "runner-a"), (2, "runner-b"), total_count=5),
+            2: _runners_response((3, "runner-c"), (4, "runner-d"), total_count=5),
+            3: _runners_response((5, "runner-e"), total_count=5),
+        }
+
+        async def get(url, headers, params):
+            return pages[params["page"]]
+
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(side_effect=get)
+        github_client.auth.get_http_client.return_value = http_client
+
+        runners = await github_client.list_runners(per_page=2)
+
+        assert [r.id for r in runners] == [1, 2, 3, 4, 5]
+        assert http_client.get.call_count == 3
+
+
+class TestRateLimiting:
+    """Tests for retrying rate-limited GitHub requests."""
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried_after_retry_after(self, github_client):
+        """Test that a 429 response is retried after the advertised delay."""
+        request = httpx.Request("GET", "https://api.github.com/orgs/test-org")
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}, request=request),
+            httpx.Response(200, json={"runner_groups": []}, request=request),
+        ]
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(side_effect=responses)
+        github_client.auth.get_http_client.return_value = http_client
+
+        with patch("app.github.client.asyncio.sleep", AsyncMock()) as sleep:
+            assert await github_client.get_runner_groups() == []
+
+        assert http_client.get.call_count == 2
+        assert 1 <= sleep.call_args.args[0] <= 1.5
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_are_bounded_exponentially(self, github_client):
+        """Test that long Retry-After values are capped at 2**attempt seconds."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(
+            return_value=httpx.Response(429, headers={"Retry-After": "600"})
+        )
+        github_client.auth.get_http_client.return_value = http_client
+
+        with patch("app.github.client.asyncio.sleep", AsyncMock()) as sleep:
+            response = await github_client._request("get", "/orgs/test-org")
+
+        assert response.status_code == 429
+        waits = [c.args[0] for c in sleep.call_args_list]
+        assert [int(w) for w in waits] == [1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_plain_403_is_not_retried(self, github_client):
+        """Test that permission errors are returned without retrying."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=httpx.Response(403))
+        github_client.auth.get_http_client.return_value = http_client
+
+        response = await github_client._request("get", "/orgs/test-org")
+
+        assert response.status_code == 403
+        http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_quota_delays_next_request(self, github_client):
+        """Test that a zero remaining quota makes later requests wait."""
+        reset = str(int(time.time()) + 30)
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+            )
+        )
+        github_client.auth.get_http_client.return_value = http_client
+
+        with patch("app.github.client.asyncio.sleep", AsyncMock()) as sleep:
+            await github_client._request("get", "/orgs/test-org")
+            sleep.assert_not_called()
+            await github_client._request("get", "/orgs/test-org")
+
+        assert sleep.call_args.args[0] == 1.0
+
+
+class TestBatchOperations:
+    """Tests for concurrent batch GitHub operations."""
+
+    @pytest.mark.asyncio
+    async def test_delete_runners(self, github_client):
+        """Test that results are returned per ID, in order."""
+        not_found = MagicMock()
+        not_found.status_code = 404
+        error = MagicMock()
+        error.status_code = 500
+
+        async def delete(url, headers):
+            response = MagicMock()
+            runner_id = int(url.rsplit("/", 1)[1])
+            if runner_id in (2, 3):
+                failure = not_found if runner_id == 2 else error
+                response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                    "error", request=MagicMock(), response=failure
+                )
+            return response
+
+        http_client = AsyncMock()
+        http_client.delete = AsyncMock(side_effect=delete)
+        github_client.auth.get_http_client.return_value = http_client
+
+        results = await github_client.delete_runners([1, 2, 3])
+
+        assert results[:2] == [True, False]
+        assert isinstance(results[2], httpx.HTTPStatusError)
+        github_client.auth.get_authenticated_headers.assert_called_once()
+
+
+class TestApiCaching:
+    """Tests for cached runner listings and runner groups."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_after_list_uses_cache(self, github_client):
+        """Test that a name seen by list_runners is found without a request."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=_runners_response((1, "runner-a")))
+        github_client.auth.get_http_client.return_value = http_client
+
+        await github_client.list_runners()
+        runner = await github_client.get_runner_by_name("runner-a")
+        missing = await github_client.get_runner_by_name("runner-b")
+
+        assert runner.id == 1
+        assert missing is None
+        http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_listing_is_refetched(self, github_client):
+        """Test that listings older than the TTL are not reused."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=_runners_response((1, "runner-a")))
+        github_client.auth.get_http_client.return_value = http_client
+
+        await github_client.list_runners()
+        github_client._runners_cache.ttl = 0
+        await github_client.get_runner_by_name("runner-a")
+
+        assert http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_listing(self, github_client):
+        """Test that deleting a runner forces the next listing to refetch."""
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=_runners_response((1, "runner-a")))
+        http_client.delete = AsyncMock(return_value=MagicMock())
+        github_client.auth.get_http_client.return_value = http_client
+
+        await github_client.list_runners()
+        await github_client.delete_runner(1)
+        await github_client.list_runners()
+
+        assert http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_runner_groups_cached(self, github_client):
+        """Test that runner groups are fetched once within the TTL."""
+        response = MagicMock()
+        response.content = orjson.dumps(
+            {"runner_groups": [{"id": 1, "name": "Default"}]}
+        )
+        http_client = AsyncMock()
+        http_client.get = AsyncMock(return_value=response)
+        github_client.auth.get_http_client.return_value = http_client
+
+        first = await github_client.get_runner_groups()
+        second = await github_client.get_runner_groups()
+
+        assert first == second == [{"id": 1, "name": "Default"}]
+        http_client.get.assert_called_once()
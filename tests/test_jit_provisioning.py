@@ -11,6 +11,7 @@ Tests cover:
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -70,6 +71,20 @@ class TestJitProvisionRequest:
         with pytest.raises(ValueError, match="alphanumeric"):
             JitProvisionRequest(runner_name="test-runner", labels=["bad label!"])
 
+    def test_name_of_only_separators_rejected(self):
+        """Test that names made only of hyphens/underscores are rejected."""
+        with pytest.raises(ValueError, match="alphanumeric"):
+            JitProvisionRequest(runner_name="-_-", labels=["test"])
+        with pytest.raises(ValueError, match="alphanumeric"):
+            JitProvisionRequest(runner_name_prefix="--", labels=["test"])
+
+    def test_label_with_separators_accepted(self):
+        """Test that labels mixing letters, digits, hyphens and underscores pass."""
+        request = JitProvisionRequest(
+            runner_name="runner_1", labels=["self-hosted", "gpu_a100", "x-1_2"]
+        )
+        assert request.labels == ["self-hosted", "gpu_a100", "x-1_2"]
+
 
 class TestJitProvisionEndpoint:
     """Tests for JIT provisioning endpoint."""
@@ -92,7 +107,7 @@ class TestJitProvisionEndpoint:
             labels=["self-hosted", "linux", "x64", "test"],
         )
 
-        with patch("app.services.runner_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.runner_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.generate_jit_config = AsyncMock(return_value=mock_jit_response)
             MockGitHubClient.return_value = mock_github
@@ -135,7 +150,7 @@ class TestJitProvisionEndpoint:
             labels=["self-hosted", "linux", "x64"],
         )
 
-        with patch("app.services.runner_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.runner_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.generate_jit_config = AsyncMock(return_value=mock_jit_response)
             MockGitHubClient.return_value = mock_github
@@ -165,7 +180,7 @@ class TestJitProvisionEndpoint:
         test_db.add(existing_runner)
         test_db.commit()
 
-        with patch("app.services.runner_service.GitHubClient"):
+        with patch("app.services.runner_service.get_github_client"):
             response = client.post(
                 "/api/v1/runners/jit",
                 json={"runner_name": "existing-runner", "labels": ["test"]},
@@ -189,7 +204,7 @@ class TestJitProvisionEndpoint:
         test_team.optional_label_patterns = json.dumps([])
         test_db.commit()
 
-        with patch("app.services.runner_service.GitHubClient"):
+        with patch("app.services.runner_service.get_github_client"):
             response = client.post(
                 "/api/v1/runners/jit",
                 json={"runner_name": "test-runner", "labels": ["forbidden-label"]},
@@ -233,7 +248,7 @@ class TestJitLabelDriftDetection:
             "unauthorized-label",
         ]
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[mock_github_runner])
             mock_github.delete_runner = AsyncMock(return_value=True)
@@ -284,7 +299,7 @@ class TestJitLabelDriftDetection:
         mock_github_runner.busy = True  # Busy!
         mock_github_runner.labels = ["drifted-label"]
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[mock_github_runner])
             mock_github.delete_runner = AsyncMock(return_value=True)
@@ -336,7 +351,7 @@ class TestJitLabelDriftDetection:
         mock_github_runner.busy = True
         mock_github_runner.labels = ["drifted-label"]
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[mock_github_runner])
             mock_github.delete_runner = AsyncMock(return_value=True)
@@ -384,29 +399,26 @@ class TestJitGitHubClient:
         }
 
         with patch("app.github.client.GitHubAppAuth") as MockAuth:
+            mock_client = AsyncMock()
+            mock_response_obj = MagicMock()
+            mock_response_obj.content = orjson.dumps(mock_response)
+            mock_response_obj.raise_for_status = MagicMock()
+            mock_client.post = AsyncMock(return_value=mock_response_obj)
+
             mock_auth = AsyncMock()
             mock_auth.get_authenticated_headers = AsyncMock(
                 return_value={"Authorization": "Bearer token"}
             )
+            mock_auth.get_http_client = AsyncMock(return_value=mock_client)
             MockAuth.return_value = mock_auth
 
-            with patch("httpx.AsyncClient") as MockClient:
-                mock_client = AsyncMock()
-                mock_response_obj = MagicMock()
-                mock_response_obj.json.return_value = mock_response
-                mock_response_obj.raise_for_status = MagicMock()
-                mock_client.post = AsyncMock(return_value=mock_response_obj)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                MockClient.return_value = mock_client
-
-                client = GitHubClient(mock_settings)
-                result = await client.generate_jit_config(
-                    name="test-runner",
-                    runner_group_id=1,
-                    labels=["test"],
-                    work_folder="_work",
-                )
+            client = GitHubClient(mock_settings)
+            result = await client.generate_jit_config(
+                name="test-runner",
+                runner_group_id=1,
+                labels=["test"],
+                work_folder="_work",
+            )
 
         assert result.runner_id == 12345
         assert result.runner_name == "test-runner"
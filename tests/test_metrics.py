@@ -187,7 +187,7 @@ class TestSyncTransitionMetrics:
         github_runner.busy = False
         github_runner.labels = ["self-hosted"]
 
-        with mock.patch("app.services.sync_service.GitHubClient") as MockClient:
+        with mock.patch("app.services.sync_service.get_github_client") as MockClient:
             MockClient.return_value.list_runners = AsyncMock(
                 return_value=[github_runner]
             )
@@ -205,7 +205,7 @@ class TestSyncTransitionMetrics:
         }
         before = _counter_value(_TRANSITIONS, lbls)
 
-        with mock.patch("app.services.sync_service.GitHubClient") as MockClient:
+        with mock.patch("app.services.sync_service.get_github_client") as MockClient:
             MockClient.return_value.list_runners = AsyncMock(return_value=[])
             service = SyncService(mock_settings, test_db)
             asyncio.get_event_loop().run_until_complete(service.sync_all_runners())
@@ -233,7 +233,7 @@ class TestRunnersByStatusGauge:
         github_runner.busy = False
         github_runner.labels = ["self-hosted"]
 
-        with mock.patch("app.services.sync_service.GitHubClient") as MockClient:
+        with mock.patch("app.services.sync_service.get_github_client") as MockClient:
             MockClient.return_value.list_runners = AsyncMock(
                 return_value=[github_runner]
             )
@@ -246,7 +246,7 @@ class TestRunnersByStatusGauge:
     def test_gauge_excludes_deleted_runners(self, test_db: Session, mock_settings):
         _make_runner(test_db, name="rd", status="deleted", team_name="t-a")
 
-        with mock.patch("app.services.sync_service.GitHubClient") as MockClient:
+        with mock.patch("app.services.sync_service.get_github_client") as MockClient:
             MockClient.return_value.list_runners = AsyncMock(return_value=[])
             service = SyncService(mock_settings, test_db)
             asyncio.get_event_loop().run_until_complete(service.sync_all_runners())
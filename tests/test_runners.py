@@ -241,7 +241,7 @@ class TestDeleteRunner:
         runner_id = runner.id
 
         # Mock the GitHub client to avoid actual API calls
-        with patch("app.services.runner_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.runner_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.delete_runner = AsyncMock(return_value=True)
             MockGitHubClient.return_value = mock_github
@@ -270,7 +270,7 @@ class TestDeleteRunner:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.runner_service.GitHubClient"):
+        with patch("app.services.runner_service.get_github_client"):
             response = client.delete(f"/api/v1/runners/{runner.id}")
 
         # Should return 400 because runner is already deleted
@@ -316,7 +316,9 @@ class TestDeleteRunner:
         app.dependency_overrides[get_current_user] = override_get_current_user
 
         try:
-            with patch("app.services.runner_service.GitHubClient") as MockGitHubClient:
+            with patch(
+                "app.services.runner_service.get_github_client"
+            ) as MockGitHubClient:
                 mock_github = AsyncMock()
                 mock_github.delete_runner = AsyncMock(return_value=True)
                 MockGitHubClient.return_value = mock_github
@@ -363,7 +365,7 @@ class TestRefreshRunner:
         test_db.refresh(runner)
 
         # Mock GitHub client
-        with patch("app.services.runner_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.runner_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github_runner = MagicMock()
             mock_github_runner.id = 12345
@@ -377,3 +379,31 @@ class TestRefreshRunner:
         data = response.json()
         assert data["status"] == "online"
         assert data["github_runner_id"] == 12345
+
+
+class TestRunnerLabelList:
+    """Tests for the decoded Runner.label_list property."""
+
+    def test_label_list_decodes_labels(self):
+        """Test that label_list returns the decoded JSON labels."""
+        runner = Runner(labels=json.dumps(["linux", "x64"]))
+        assert runner.label_list == ["linux", "x64"]
+
+    def test_label_list_empty_labels(self):
+        """Test that empty labels decode to an empty list."""
+        runner = Runner(labels="")
+        assert runner.label_list == []
+
+    def test_label_list_follows_column_changes(self):
+        """Test that the cached value is refreshed when labels change."""
+        runner = Runner(labels=json.dumps(["old"]))
+        assert runner.label_list == ["old"]
+
+        runner.labels = json.dumps(["new"])
+        assert runner.label_list == ["new"]
+
+    def test_label_list_mutation_does_not_leak(self):
+        """Test that modifying a returned list leaves the cached labels intact."""
+        runner = Runner(labels=json.dumps(["linux", "x64"]))
+        runner.label_list.append("gpu")
+        assert runner.label_list == ["linux", "x64"]
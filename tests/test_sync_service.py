@@ -38,7 +38,7 @@ class TestSyncService:
 
     def test_sync_no_runners(self, test_db: Session, mock_settings):
         """Test sync when no runners exist."""
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[])
             MockGitHubClient.return_value = mock_github
@@ -70,7 +70,7 @@ class TestSyncService:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             # Mock GitHub runner - labels match what was provisioned
             mock_github_runner = MagicMock()
             mock_github_runner.id = 12345
@@ -117,7 +117,7 @@ class TestSyncService:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[])  # Runner not found
             MockGitHubClient.return_value = mock_github
@@ -158,7 +158,7 @@ class TestSyncService:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[])
             MockGitHubClient.return_value = mock_github
@@ -195,7 +195,7 @@ class TestSyncService:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github = AsyncMock()
             mock_github.list_runners = AsyncMock(return_value=[])
             MockGitHubClient.return_value = mock_github
@@ -232,7 +232,7 @@ class TestSyncService:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient") as MockGitHubClient:
+        with patch("app.services.sync_service.get_github_client") as MockGitHubClient:
             mock_github_runner = MagicMock()
             mock_github_runner.id = 12345
             mock_github_runner.name = "stable-runner"
@@ -255,13 +255,43 @@ class TestSyncService:
             assert result.unchanged == 1
             assert result.updated == 0
 
+    def test_invalid_stored_labels_skip_drift_check(
+        self, test_db: Session, mock_settings
+    ):
+        """Test that undecodable stored labels are not treated as drift."""
+        runner = Runner(
+            runner_name="broken-labels-runner",
+            runner_group_id=1,
+            labels="not-json",
+            provisioned_by="user@example.com",
+            status="online",
+            github_runner_id=12345,
+            github_url="https://github.com/test-org",
+        )
+        test_db.add(runner)
+        test_db.commit()
+
+        github_runner = MagicMock()
+        github_runner.labels = ["self-hosted", "linux"]
+
+        with patch("app.services.sync_service.get_github_client"):
+            service = SyncService(mock_settings, test_db)
+
+            import asyncio
+
+            drifted = asyncio.get_event_loop().run_until_complete(
+                service._check_label_drift(runner, github_runner)
+            )
+
+        assert drifted is False
+
 
 class TestSyncSingleRunner:
     """Tests for syncing individual runners."""
 
     def test_sync_single_runner_not_found(self, test_db: Session, mock_settings):
         """Test syncing non-existent runner returns None."""
-        with patch("app.services.sync_service.GitHubClient"):
+        with patch("app.services.sync_service.get_github_client"):
             service = SyncService(mock_settings, test_db)
 
             import asyncio
@@ -287,7 +317,7 @@ class TestSyncSingleRunner:
         test_db.commit()
         test_db.refresh(runner)
 
-        with patch("app.services.sync_service.GitHubClient"):
+        with patch("app.services.sync_service.get_github_client"):
             service = SyncService(mock_settings, test_db)
 
             import asyncio
@@ -135,6 +135,18 @@ async def test_worker_graceful_shutdown():
     assert worker.shutdown_requested is True
 
 
+@pytest.mark.asyncio
+async def test_worker_shutdown_interrupts_pause():
+    """Test a shutdown request ends the interval wait immediately."""
+    worker = SyncWorker()
+
+    pause = asyncio.create_task(worker._pause(60))
+    await asyncio.sleep(0)
+    worker.request_shutdown()
+
+    await asyncio.wait_for(pause, timeout=1.0)
+
+
 @pytest.mark.asyncio
 @patch("app.worker.SyncService")
 async def test_worker_run_sync_cycle(mock_sync_service_class, test_db):
@@ -160,8 +172,8 @@ async def test_worker_run_sync_cycle(mock_sync_service_class, test_db):
 
     # Mock SessionLocal to return our test_db
     with patch("app.worker.SessionLocal", return_value=test_db):
-        # Mock sleep to avoid waiting
-        with patch("asyncio.sleep", new_callable=AsyncMock):
+        # Mock the interval wait to avoid waiting
+        with patch.object(worker, "_pause", new_callable=AsyncMock):
             # Run one sync cycle (will be interrupted by our mock)
             try:
                 await asyncio.wait_for(worker._run_sync_cycle(), timeout=1.0)
@@ -196,7 +208,7 @@ async def test_worker_handles_sync_error(test_db):
 
         # Mock SessionLocal to return our test_db
         with patch("app.worker.SessionLocal", return_value=test_db):
-            with patch("asyncio.sleep", new_callable=AsyncMock):
+            with patch.object(worker, "_pause", new_callable=AsyncMock):
                 try:
                     await asyncio.wait_for(worker._run_sync_cycle(), timeout=1.0)
                 except asyncio.TimeoutError:
@@ -7,6 +7,13 @@ from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
 from app.models import Runner, Team, User
+from app.services.label_policy_service import (
+    LabelPolicyService,
+    LabelPolicyViolation,
+    combine_label_patterns,
+    compile_label_patterns,
+    parse_team_label_policy,
+)
 from app.services.team_service import TeamPolicyViolation, TeamService
 
 
@@ -449,6 +456,70 @@ class TestLabelPolicyEnforcement:
             team_service.validate_and_merge_labels(sample_team.id, [])
 
 
+class TestCompileLabelPatterns:
+    """Test cached compilation of optional label patterns."""
+
+    def test_invalid_patterns_skipped(self):
+        """Test that invalid regexes are dropped and valid ones kept in order."""
+        compiled = compile_label_patterns(("feature-.*", "([unclosed", "env-.*"))
+
+        assert [p.pattern for p in compiled] == ["feature-.*", "env-.*"]
+
+    def test_compiled_once_per_pattern_set(self):
+        """Test that the same patterns return the cached compiled tuple."""
+        patterns = ("team-a-.*", "team-b-.*")
+
+        assert compile_label_patterns(patterns) is compile_label_patterns(patterns)
+
+    def test_policy_reparsed_only_when_columns_change(self):
+        """Test that decoded team policies are cached by stored JSON."""
+        required = json.dumps(["team-a"])
+        patterns = json.dumps(["feature-.*"])
+
+        policy = parse_team_label_policy(required, patterns)
+
+        assert policy.required_labels == ("team-a",)
+        assert policy.optional_patterns == ("feature-.*",)
+        assert policy is parse_team_label_policy(required, patterns)
+        assert policy is not parse_team_label_policy(required, json.dumps(["env-.*"]))
+        assert parse_team_label_policy(required, None).label_matchers == ()
+
+    def test_patterns_fused_into_one_alternation(self):
+        """Test that fused patterns keep per-pattern prefix-match semantics."""
+        policy = parse_team_label_policy("[]", json.dumps(["feature-.*", "env-\\d+"]))
+
+        assert len(policy.label_matchers) == 1
+        assert policy.allows("feature-x")
+        assert policy.allows("env-1-extra")
+        assert not policy.allows("prod")
+
+    def test_unsafe_patterns_not_fused(self):
+        """Test that group references and inline flags fall back to per-pattern."""
+        backref = compile_label_patterns(("(a)-.*", "(b)\\1"))
+        conditional = compile_label_patterns(("(a)-.*", "(b)?(?(1)x|y)"))
+        inline_flag = compile_label_patterns(("feature-.*", "(?i)env-.*"))
+
+        assert combine_label_patterns(backref) == backref
+        assert combine_label_patterns(conditional) == conditional
+        assert combine_label_patterns(inline_flag) == inline_flag
+
+    def test_label_policy_service_enforces_patterns(
+        self, test_db: Session, sample_team: Team
+    ):
+        """Test team label enforcement through the cached policy."""
+        service = LabelPolicyService(test_db)
+
+        service.validate_labels_for_team(
+            sample_team.id, ["self-hosted", "platform", "production", "env-dev"]
+        )
+        with pytest.raises(LabelPolicyViolation) as exc_info:
+            service.validate_labels_for_team(
+                sample_team.id, ["platform", "production", "gpu"]
+            )
+
+        assert exc_info.value.invalid_labels == {"gpu"}
+
+
 class TestTeamQuota:
     """Test team quota enforcement."""
 